@@ -5,9 +5,16 @@ Real-time News Collection Script
 Collects US stock market news using Massive API.
 """
 
+import argparse
+import hashlib
+import heapq
 import os
 import sys
+from collections import Counter, deque
 from datetime import datetime
+from functools import partial
+from itertools import chain
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -18,16 +25,19 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.data.news_collector import MassiveNewsCollector
-from src.notification.discord_notifier import DiscordNotifier
+from src.notification.discord_notifier import DiscordNotifier, get_notifier
 from src.utils.config_loader import ConfigLoader
 
+# Output directories (created once at import instead of on every save)
+LOG_DIR = project_root / "data" / "logs"
+NEWS_DIR = project_root / "data" / "news"
+LOG_DIR.mkdir(parents=True, exist_ok=True)
+NEWS_DIR.mkdir(parents=True, exist_ok=True)
+
 
 def setup_logging():
     """Configure logging."""
-    log_dir = project_root / "data" / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    log_file = log_dir / f"news_collection_{datetime.now().strftime('%Y%m%d')}.log"
+    log_file = LOG_DIR / f"news_collection_{datetime.now().strftime('%Y%m%d')}.log"
 
     # Remove default handler
     logger.remove()
@@ -45,37 +55,119 @@ def setup_logging():
         format="{time:YYYY-MM-DD HH:mm:ss} | {level:8} | {message}",
         level="DEBUG",
         rotation="100 MB",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
 
-def on_new_article(article, notifier=None):
+def write_article(f, article) -> None:
     """
-    Callback function for new articles.
+    Append one article to an NDJSON file.
 
     Args:
+        f: File object opened in binary mode
         article: NewsArticle object
-        notifier: Optional DiscordNotifier
     """
-    logger.info(f"NEW: {article.title}")
-    logger.info(f"  Tickers: {', '.join(article.tickers)}")
-    logger.info(f"  Sentiment: {article.overall_sentiment}")
-    logger.info(f"  URL: {article.article_url}")
+    # Serialized straight to JSON by pydantic-core (no intermediate dict)
+    f.write(article.model_dump_json().encode())
+    f.write(b"\n")
 
-    # Send to Discord if notifier is available
-    if notifier:
-        try:
-            # Send notification for high-impact news
-            if len(article.tickers) >= 3 or article.overall_sentiment != "neutral":
-                notifier.send_realtime_signal(
-                    ticker=", ".join(article.tickers[:3]),
-                    action="NEWS",
-                    confidence=1.0,
-                    reasoning=article.description or article.title,
-                    news_title=article.title,
-                    news_url=str(article.article_url),
-                )
-        except Exception as e:
-            logger.error(f"Failed to send Discord notification: {e}")
+
+class SeenUrls:
+    """Bounded set of recently processed article URLs, keyed by a 64-bit digest."""
+
+    def __init__(self, maxlen: int = 10_000):
+        """
+        Initialize URL set.
+
+        Args:
+            maxlen: Number of URLs to remember (oldest are evicted first)
+        """
+        self._order: deque[int] = deque(maxlen=maxlen)
+        self._hashes: set[int] = set()
+
+    def add(self, url: str) -> bool:
+        """
+        Record a URL.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            True if the URL is new, False if it was seen recently
+        """
+        digest = int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest())
+        if digest in self._hashes:
+            return False
+
+        if len(self._order) == self._order.maxlen:
+            self._hashes.discard(self._order[0])
+        self._order.append(digest)
+        self._hashes.add(digest)
+        return True
+
+
+def on_new_article(article, output_file=None, seen_urls=None) -> bool:
+    """
+    Callback function for new articles (log and save only).
+
+    Args:
+        article: NewsArticle object
+        output_file: Optional binary file object to append the article to (NDJSON)
+        seen_urls: Optional SeenUrls used to skip articles already processed
+
+    Returns:
+        True if the article was processed, False if it was a duplicate
+    """
+    # Same story re-published under a new id (syndication, edits): skip it
+    if seen_urls is not None and not seen_urls.add(str(article.article_url)):
+        logger.debug(f"Skipping duplicate article URL: {article.article_url}")
+        return False
+
+    logger.info(
+        "NEW: {}\n  Tickers: {}\n  Sentiment: {}\n  URL: {}",
+        article.title,
+        ", ".join(article.tickers),
+        article.overall_sentiment,
+        article.article_url,
+    )
+
+    if output_file:
+        write_article(output_file, article)
+
+    return True
+
+
+def on_new_article_notify(article, notifier, output_file=None, seen_urls=None):
+    """
+    Callback function for new articles that also alerts Discord on high-impact news.
+
+    Args:
+        article: NewsArticle object
+        notifier: DiscordNotifier
+        output_file: Optional binary file object to append the article to (NDJSON)
+        seen_urls: Optional SeenUrls used to skip articles already processed
+    """
+    if not on_new_article(article, output_file, seen_urls):
+        return
+
+    # Send notification for high-impact news
+    high_impact = len(article.tickers) >= 3 or article.overall_sentiment != "neutral"
+    if not high_impact:
+        return
+
+    try:
+        notifier.send_realtime_signal(
+            ticker=", ".join(article.tickers[:3]),
+            action="NEWS",
+            confidence=1.0,
+            reasoning=article.description or article.title,
+            news_title=article.title,
+            news_url=str(article.article_url),
+        )
+    except Exception as e:
+        logger.error(f"Failed to send Discord notification: {e}")
 
 
 def collect_historical(collector: MassiveNewsCollector, tickers: list, hours_back: int = 24):
@@ -95,38 +187,29 @@ def collect_historical(collector: MassiveNewsCollector, tickers: list, hours_bac
 
     logger.info(f"Found {len(articles)} articles")
 
-    # Save to JSON for later analysis
+    # Save to NDJSON (one article per line) for later analysis
     if articles:
-        output_dir = project_root / "data" / "news"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = NEWS_DIR / f"news_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
 
-        output_file = output_dir / f"news_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-
-        import json
-
-        with open(output_file, "w") as f:
-            json.dump([article.model_dump() for article in articles], f, indent=2, default=str)
+        with open(output_file, "wb") as f:
+            for article in articles:
+                write_article(f, article)
 
         logger.info(f"Saved to: {output_file}")
 
     # Display summary
-    sentiment_summary = {"positive": 0, "negative": 0, "neutral": 0}
-    ticker_counts = {}
-
-    for article in articles:
-        sentiment_summary[article.overall_sentiment] += 1
+    sentiment_summary = Counter(dict.fromkeys(("positive", "negative", "neutral"), 0))
+    sentiment_summary.update(article.overall_sentiment for article in articles)
+    ticker_counts = Counter(chain.from_iterable(article.tickers for article in articles))
 
-        for ticker in article.tickers:
-            ticker_counts[ticker] = ticker_counts.get(ticker, 0) + 1
-
-    logger.info("\nSentiment Distribution:")
-    for sentiment, count in sentiment_summary.items():
-        logger.info(f"  {sentiment.capitalize()}: {count}")
+    lines = ["\nSentiment Distribution:"]
+    lines.extend(
+        f"  {sentiment.capitalize()}: {count}" for sentiment, count in sentiment_summary.items()
+    )
 
-    logger.info("\nTop 10 Most Mentioned Tickers:")
-    sorted_tickers = sorted(ticker_counts.items(), key=lambda x: x[1], reverse=True)
-    for ticker, count in sorted_tickers[:10]:
-        logger.info(f"  {ticker}: {count} articles")
+    lines.append("\nTop 10 Most Mentioned Tickers:")
+    lines.extend(f"  {ticker}: {count} articles" for ticker, count in ticker_counts.most_common(10))
+    logger.info("\n".join(lines))
 
 
 def collect_realtime(
@@ -155,34 +238,81 @@ def collect_realtime(
     else:
         logger.info("Duration: Indefinite (press Ctrl+C to stop)")
 
-    # Create callback with notifier
-    def callback(article):
-        on_new_article(article, notifier)
-
-    # Start collection
-    stats = collector.collect_realtime_news(
-        tickers=tickers,
-        poll_interval=poll_interval,
-        callback=callback,
-        duration_minutes=duration_minutes,
-    )
-
-    # Display final statistics
-    logger.info("\n" + "=" * 60)
-    logger.info("Collection Statistics")
-    logger.info("=" * 60)
-    logger.info(f"Total articles: {stats.total_articles}")
-    logger.info(f"Duration: {stats.duration_seconds:.0f} seconds")
-
-    logger.info("\nSentiment Distribution:")
+    # Append each new article to an NDJSON file as it arrives
+    output_path = NEWS_DIR / f"news_realtime_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+
+    seen_urls = SeenUrls()
+
+    with open(output_path, "ab") as output_file:
+        # Pick the callback once instead of checking for a notifier per article
+        if notifier is None:
+            callback = partial(on_new_article, output_file=output_file, seen_urls=seen_urls)
+        else:
+            callback = partial(
+                on_new_article_notify,
+                notifier=notifier,
+                output_file=output_file,
+                seen_urls=seen_urls,
+            )
+
+        # Start collection
+        stats = collector.collect_realtime_news(
+            tickers=tickers,
+            poll_interval=poll_interval,
+            callback=callback,
+            duration_minutes=duration_minutes,
+        )
+
+    logger.info(f"Saved to: {output_path}")
+
+    # Display final statistics (one log record for the whole report)
+    lines = [
+        "\n" + "=" * 60,
+        "Collection Statistics",
+        "=" * 60,
+        f"Total articles: {stats.total_articles}",
+        f"Duration: {stats.duration_seconds:.0f} seconds",
+        "\nSentiment Distribution:",
+    ]
     for sentiment, count in stats.sentiment_distribution.items():
         percentage = (count / stats.total_articles * 100) if stats.total_articles > 0 else 0
-        logger.info(f"  {sentiment.capitalize()}: {count} ({percentage:.1f}%)")
-
-    logger.info("\nTop 10 Most Active Tickers:")
-    sorted_tickers = sorted(stats.articles_per_ticker.items(), key=lambda x: x[1], reverse=True)
-    for ticker, count in sorted_tickers[:10]:
-        logger.info(f"  {ticker}: {count} articles")
+        lines.append(f"  {sentiment.capitalize()}: {count} ({percentage:.1f}%)")
+
+    lines.append("\nTop 10 Most Active Tickers:")
+    top_tickers = heapq.nlargest(10, stats.articles_per_ticker.items(), key=itemgetter(1))
+    lines.extend(f"  {ticker}: {count} articles" for ticker, count in top_tickers)
+    logger.info("\n".join(lines))
+
+
+# Command line arguments (built once at import)
+_PARSER = argparse.ArgumentParser(description="Collect US stock market news")
+_PARSER.add_argument(
+    "--mode",
+    choices=["historical", "realtime", "both"],
+    default="both",
+    help="Collection mode (default: both)",
+)
+_PARSER.add_argument(
+    "--hours", type=int, default=24, help="Hours to look back for historical data (default: 24)"
+)
+_PARSER.add_argument(
+    "--interval",
+    type=int,
+    default=60,
+    help="Poll interval in seconds for realtime mode (default: 60)",
+)
+_PARSER.add_argument(
+    "--duration",
+    type=int,
+    default=None,
+    help="Duration in minutes for realtime mode (default: indefinite)",
+)
+_PARSER.add_argument(
+    "--tickers",
+    nargs="+",
+    default=None,
+    help="Specific tickers to monitor (default: all from config)",
+)
 
 
 def main():
@@ -201,7 +331,7 @@ def main():
     try:
         config_loader = ConfigLoader()
         stocks = config_loader.load_stocks()
-        tickers = [stock.ticker for stock in stocks]
+        tickers = list(map(attrgetter("ticker"), stocks))
 
         logger.info(f"Loaded {len(tickers)} tickers from config")
         logger.info(f"Tickers: {', '.join(tickers)}")
@@ -230,48 +360,17 @@ def main():
     discord_webhook = os.getenv("DISCORD_WEBHOOK_URL")
     if discord_webhook:
         try:
-            notifier = DiscordNotifier(discord_webhook)
+            notifier = get_notifier(discord_webhook)
             logger.info("Discord notifier initialized")
         except Exception as e:
             logger.warning(f"Discord notifier not available: {e}")
 
     # Parse command line arguments
-    import argparse
-
-    parser = argparse.ArgumentParser(description="Collect US stock market news")
-    parser.add_argument(
-        "--mode",
-        choices=["historical", "realtime", "both"],
-        default="both",
-        help="Collection mode (default: both)",
-    )
-    parser.add_argument(
-        "--hours", type=int, default=24, help="Hours to look back for historical data (default: 24)"
-    )
-    parser.add_argument(
-        "--interval",
-        type=int,
-        default=60,
-        help="Poll interval in seconds for realtime mode (default: 60)",
-    )
-    parser.add_argument(
-        "--duration",
-        type=int,
-        default=None,
-        help="Duration in minutes for realtime mode (default: indefinite)",
-    )
-    parser.add_argument(
-        "--tickers",
-        nargs="+",
-        default=None,
-        help="Specific tickers to monitor (default: all from config)",
-    )
-
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
     # Override tickers if specified
     if args.tickers:
-        tickers = [t.upper() for t in args.tickers]
+        tickers = list(map(str.upper, args.tickers))
         logger.info(f"Using specified tickers: {', '.join(tickers)}")
 
     # Run collection
@@ -288,11 +387,8 @@ def main():
     except KeyboardInterrupt:
         logger.info("\nCollection stopped by user")
 
-    except Exception as e:
-        logger.error(f"Collection error: {e}")
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Collection error")
         sys.exit(1)
 
     logger.info("\nCollection completed successfully")
@@ -5,10 +5,14 @@ Real-time Price Collection Script
 Collects US stock market prices and volumes using Finnhub API.
 """
 
-import json
+import argparse
+import math
 import os
 import sys
-from datetime import datetime
+import time
+from array import array
+from datetime import UTC, datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -18,17 +22,27 @@ from loguru import logger
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from src.data.models import PriceSnapshot
 from src.data.price_collector import FinnhubPriceCollector
-from src.notification.discord_notifier import DiscordNotifier
+from src.notification.discord_notifier import DiscordNotifier, get_notifier
+from src.notification.notification_queue import NotificationQueue
 from src.utils.config_loader import ConfigLoader
 
+# Output directories (created once at import instead of on every save)
+LOG_DIR = project_root / "data" / "logs"
+PRICES_DIR = project_root / "data" / "prices"
+LOG_DIR.mkdir(parents=True, exist_ok=True)
+PRICES_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _clock(t: datetime) -> str:
+    """Format a datetime as HH:MM:SS."""
+    return f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+
 
 def setup_logging():
     """Configure logging."""
-    log_dir = project_root / "data" / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    log_file = log_dir / f"price_collection_{datetime.now().strftime('%Y%m%d')}.log"
+    log_file = LOG_DIR / f"price_collection_{datetime.now().strftime('%Y%m%d')}.log"
 
     # Remove default handler
     logger.remove()
@@ -38,37 +52,145 @@ def setup_logging():
         sys.stderr,
         format="<green>{time:HH:mm:ss}</green> | <level>{level:8}</level> | <level>{message}</level>",
         level=os.getenv("LOG_LEVEL", "INFO"),
+        enqueue=True,
     )
 
-    # Add file handler
+    # Add file handler (enqueue: sink I/O runs off the WebSocket callback thread)
     logger.add(
         log_file,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level:8} | {message}",
         level="DEBUG",
         rotation="100 MB",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
 
-def save_quotes_to_file(quotes, tickers):
+def _snapshot_file(output_dir: Path, collected_at: datetime) -> Path:
+    """Hourly NDJSON file a snapshot belongs to (named in local time)."""
+    return output_dir / f"prices_{collected_at.astimezone().strftime('%Y%m%d_%H')}.jsonl"
+
+
+def _snapshot_line(quotes) -> tuple[datetime, bytes]:
     """
-    Save quotes to JSON file.
+    Serialize one snapshot as an NDJSON line.
 
     Args:
         quotes: Dictionary of StockQuote objects
-        tickers: List of ticker symbols
+
+    Returns:
+        Tuple of (collection time, encoded line)
     """
-    output_dir = project_root / "data" / "prices"
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Typed model: pydantic-core serializes it in one pass, no per-field reflection
+    snapshot = PriceSnapshot(collected_at=datetime.now(UTC), quotes=quotes)
+    return snapshot.collected_at, snapshot.model_dump_json().encode() + b"\n"
 
-    output_file = output_dir / f"prices_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
-    # Convert to dict
-    quotes_data = {ticker: quote.model_dump() for ticker, quote in quotes.items()}
+class PriceSnapshotWriter:
+    """
+    Buffers price snapshots and appends them to hourly NDJSON files in batches.
 
-    with open(output_file, "w") as f:
-        json.dump(quotes_data, f, indent=2, default=str)
+    Use as a context manager so buffered snapshots are flushed on exit.
+    """
 
-    logger.info(f"Saved quotes to: {output_file}")
+    def __init__(self, output_dir: Path, batch_size: int = 64, flush_interval: float = 5.0):
+        """
+        Initialize snapshot writer.
+
+        Args:
+            output_dir: Directory for prices_YYYYmmdd_HH.jsonl files
+            batch_size: Flush after this many buffered snapshots
+            flush_interval: Flush when this many seconds passed since the last flush
+        """
+        self.output_dir = output_dir
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        # Buffered lines grouped by target file (each snapshot's own collection hour)
+        self._pending: dict[Path, list[bytes]] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+        return False
+
+    def append(self, quotes) -> None:
+        """
+        Buffer one snapshot, flushing if the batch is full or stale.
+
+        Args:
+            quotes: Dictionary of StockQuote objects
+        """
+        collected_at, line = _snapshot_line(quotes)
+        self._pending.setdefault(_snapshot_file(self.output_dir, collected_at), []).append(line)
+        self._pending_count += 1
+
+        if (
+            self._pending_count >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> list[Path]:
+        """
+        Append buffered snapshots to the files of the hours they were collected in.
+
+        Returns:
+            Paths written to (empty if nothing was buffered)
+        """
+        self._last_flush = time.monotonic()
+        written = []
+        for output_file, lines in self._pending.items():
+            with open(output_file, "ab") as f:
+                f.writelines(lines)
+            logger.debug(f"Saved {len(lines)} snapshots to: {output_file}")
+            written.append(output_file)
+
+        self._pending.clear()
+        self._pending_count = 0
+        return written
+
+
+class PriceCache:
+    """Last traded price per ticker, kept in a flat float array indexed by ticker."""
+
+    def __init__(self, tickers: list[str]):
+        """
+        Initialize price cache.
+
+        Args:
+            tickers: Ticker symbols to track (fixed for the lifetime of the cache)
+        """
+        self.index = {ticker: i for i, ticker in enumerate(tickers)}
+        self.last_prices = array("d", [math.nan]) * len(tickers)
+
+    def update(self, ticker: str, price: float) -> float | None:
+        """
+        Store the latest price and return the change from the previous one.
+
+        Args:
+            ticker: Ticker symbol
+            price: Latest traded price
+
+        Returns:
+            Percent change from the previous price, or None for the first tick
+            (or an untracked ticker)
+        """
+        i = self.index.get(ticker)
+        if i is None:
+            return None
+
+        prev_price = self.last_prices[i]
+        self.last_prices[i] = price
+
+        if math.isnan(prev_price):
+            return None
+        return (price - prev_price) / prev_price * 100.0
 
 
 def on_price_update(price, notifier=None, price_cache=None):
@@ -77,35 +199,35 @@ def on_price_update(price, notifier=None, price_cache=None):
 
     Args:
         price: StockPrice object
-        notifier: Optional DiscordNotifier
-        price_cache: Optional dict to track price changes
+        notifier: Optional DiscordNotifier or NotificationQueue
+        price_cache: Optional PriceCache to track price changes
     """
-    logger.info(
-        f"[{price.timestamp.strftime('%H:%M:%S')}] "
-        f"{price.ticker:6s}: ${price.price:8.2f} (Vol: {price.volume:,})"
+    # Per-tick log is DEBUG and formatted only if a sink accepts it
+    logger.opt(lazy=True).debug(
+        "{}",
+        lambda: (
+            f"[{_clock(price.timestamp)}] "
+            f"{price.ticker:6s}: ${price.price:8.2f} (Vol: {price.volume:,})"
+        ),
     )
 
     # Track significant price changes
     if price_cache is not None:
-        if price.ticker in price_cache:
-            prev_price = price_cache[price.ticker]
-            change_pct = ((price.price - prev_price) / prev_price) * 100
-
-            # Send Discord notification for significant changes (>1%)
-            if notifier and abs(change_pct) >= 1.0:
-                try:
-                    action = "📈 UP" if change_pct > 0 else "📉 DOWN"
-                    notifier.send_realtime_signal(
-                        ticker=price.ticker,
-                        action=action,
-                        confidence=min(abs(change_pct) / 5.0, 1.0),
-                        reasoning=f"Price moved {change_pct:+.2f}% to ${price.price:.2f}",
-                        news_title=f"{price.ticker} significant price movement",
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to send Discord notification: {e}")
-
-        price_cache[price.ticker] = price.price
+        change_pct = price_cache.update(price.ticker, price.price)
+
+        # Send Discord notification for significant changes (>1%)
+        if notifier and change_pct is not None and abs(change_pct) >= 1.0:
+            try:
+                action = "📈 UP" if change_pct > 0 else "📉 DOWN"
+                notifier.send_realtime_signal(
+                    ticker=price.ticker,
+                    action=action,
+                    confidence=min(abs(change_pct) / 5.0, 1.0),
+                    reasoning=f"Price moved {change_pct:+.2f}% to ${price.price:.2f}",
+                    news_title=f"{price.ticker} significant price movement",
+                )
+            except Exception as e:
+                logger.error(f"Failed to send Discord notification: {e}")
 
 
 def collect_snapshot(collector: FinnhubPriceCollector, tickers: list):
@@ -123,22 +245,23 @@ def collect_snapshot(collector: FinnhubPriceCollector, tickers: list):
     logger.info(f"Received {len(quotes)} quotes")
 
     # Display quotes
-    logger.info("\n" + "=" * 60)
-    logger.info("Current Market Quotes")
-    logger.info("=" * 60)
-
-    for ticker, quote in sorted(quotes.items()):
-        logger.info(
-            f"{ticker:6s}: ${quote.current_price:8.2f} "
-            f"({quote.percent_change:+6.2f}%) "
-            f"[O:{quote.open:.2f} H:{quote.high:.2f} L:{quote.low:.2f}]"
-        )
-
-    logger.info("=" * 60)
+    lines = ["\n" + "=" * 60, "Current Market Quotes", "=" * 60]
+    lines.extend(
+        f"{ticker:6s}: ${quote.current_price:8.2f} "
+        f"({quote.percent_change:+6.2f}%) "
+        f"[O:{quote.open:.2f} H:{quote.high:.2f} L:{quote.low:.2f}]"
+        for ticker, quote in sorted(quotes.items())
+    )
+    lines.append("=" * 60)
+    logger.info("\n".join(lines))
 
     # Save to file
     if quotes:
-        save_quotes_to_file(quotes, tickers)
+        collected_at, line = _snapshot_line(quotes)
+        output_file = _snapshot_file(PRICES_DIR, collected_at)
+        with open(output_file, "ab") as f:
+            f.write(line)
+        logger.info(f"Saved quotes to: {output_file}")
 
 
 def collect_websocket(
@@ -146,6 +269,7 @@ def collect_websocket(
     tickers: list,
     duration_minutes: int = None,
     notifier: DiscordNotifier = None,
+    coalesce_seconds: float = 5.0,
 ):
     """
     Collect real-time prices using WebSocket.
@@ -155,6 +279,8 @@ def collect_websocket(
         tickers: List of ticker symbols
         duration_minutes: Duration in minutes (None = indefinite)
         notifier: Optional Discord notifier
+        coalesce_seconds: Suppress repeat alerts with the same ticker and direction
+            within this many seconds (0 = send every alert)
     """
     logger.info("Starting WebSocket price collection...")
     logger.info(f"Monitoring {len(tickers)} tickers")
@@ -165,33 +291,46 @@ def collect_websocket(
         logger.info("Duration: Indefinite (press Ctrl+C to stop)")
 
     # Price cache for tracking changes
-    price_cache = {}
+    price_cache = PriceCache(tickers)
+
+    # Send alerts from a background thread so the WebSocket callback never blocks
+    # A ticker hovering around the 1% threshold would otherwise alert on every tick;
+    # repeats in the same direction are coalesced, reversals always go through
+    notification_queue = (
+        NotificationQueue(notifier, coalesce_seconds=coalesce_seconds) if notifier else None
+    )
 
     # Create callback with notifier
     def callback(price):
-        on_price_update(price, notifier, price_cache)
+        on_price_update(price, notification_queue, price_cache)
 
     # Start collection
-    stats = collector.collect_realtime_prices(
-        tickers=tickers, callback=callback, duration_minutes=duration_minutes
-    )
-
-    # Display final statistics
-    logger.info("\n" + "=" * 60)
-    logger.info("Collection Statistics")
-    logger.info("=" * 60)
-    logger.info(f"Total updates: {stats.total_updates}")
-    logger.info(f"Duration: {stats.duration_seconds:.0f} seconds")
+    try:
+        stats = collector.collect_realtime_prices(
+            tickers=tickers, callback=callback, duration_minutes=duration_minutes
+        )
+    finally:
+        if notification_queue:
+            notification_queue.close()
+
+    # Display final statistics (one log record for the whole report)
+    lines = [
+        "\n" + "=" * 60,
+        "Collection Statistics",
+        "=" * 60,
+        f"Total updates: {stats.total_updates}",
+        f"Duration: {stats.duration_seconds:.0f} seconds",
+    ]
 
     if stats.updates_per_second:
-        logger.info(f"Updates/second: {stats.updates_per_second:.2f}")
+        lines.append(f"Updates/second: {stats.updates_per_second:.2f}")
 
-    logger.info(f"Connection errors: {stats.connection_errors}")
+    lines.append(f"Connection errors: {stats.connection_errors}")
 
-    logger.info("\nUpdates per ticker:")
-    sorted_tickers = sorted(stats.updates_per_ticker.items(), key=lambda x: x[1], reverse=True)
-    for ticker, count in sorted_tickers:
-        logger.info(f"  {ticker:6s}: {count} updates")
+    lines.append("\nUpdates per ticker:")
+    sorted_tickers = sorted(stats.updates_per_ticker.items(), key=itemgetter(1), reverse=True)
+    lines.extend(f"  {ticker:6s}: {count} updates" for ticker, count in sorted_tickers)
+    logger.info("\n".join(lines))
 
 
 def collect_polling(
@@ -215,30 +354,69 @@ def collect_polling(
     else:
         logger.info("Duration: Indefinite (press Ctrl+C to stop)")
 
-    # Callback for each poll
-    def callback(quotes):
-        timestamp = datetime.utcnow().strftime("%H:%M:%S")
-        logger.info(f"\n[{timestamp}] Price Update:")
-        for ticker, quote in sorted(quotes.items()):
-            logger.info(
+    # Snapshots are buffered and appended to hourly NDJSON files (flushed on exit)
+    with PriceSnapshotWriter(PRICES_DIR) as writer:
+        # Callback for each poll
+        def callback(quotes):
+            writer.append(quotes)
+            timestamp = _clock(datetime.now(UTC))
+            lines = [f"\n[{timestamp}] Price Update:"]
+            lines.extend(
                 f"  {ticker:6s}: ${quote.current_price:8.2f} ({quote.percent_change:+6.2f}%)"
+                for ticker, quote in sorted(quotes.items())
             )
-
-    # Start polling
-    stats = collector.poll_prices(
-        tickers=tickers,
-        interval_seconds=interval,
-        callback=callback,
-        duration_minutes=duration_minutes,
-    )
+            logger.info("\n".join(lines))
+
+        # Start polling
+        stats = collector.poll_prices(
+            tickers=tickers,
+            interval_seconds=interval,
+            callback=callback,
+            duration_minutes=duration_minutes,
+        )
 
     # Display final statistics
-    logger.info("\n" + "=" * 60)
-    logger.info("Collection Statistics")
-    logger.info("=" * 60)
-    logger.info(f"Total updates: {stats.total_updates}")
-    logger.info(f"Duration: {stats.duration_seconds:.0f} seconds")
-    logger.info(f"Total polls: {stats.total_updates // len(tickers) if tickers else 0}")
+    lines = [
+        "\n" + "=" * 60,
+        "Collection Statistics",
+        "=" * 60,
+        f"Total updates: {stats.total_updates}",
+        f"Duration: {stats.duration_seconds:.0f} seconds",
+        f"Total polls: {stats.total_updates // len(tickers) if tickers else 0}",
+    ]
+    logger.info("\n".join(lines))
+
+
+# Command line arguments (built once at import)
+_PARSER = argparse.ArgumentParser(description="Collect US stock market prices")
+_PARSER.add_argument(
+    "--mode",
+    choices=["snapshot", "websocket", "polling"],
+    default="websocket",
+    help="Collection mode (default: websocket)",
+)
+_PARSER.add_argument(
+    "--interval",
+    type=int,
+    default=5,
+    help="Poll interval in seconds for polling mode (default: 5)",
+)
+_PARSER.add_argument(
+    "--duration", type=int, default=None, help="Duration in minutes (default: indefinite)"
+)
+_PARSER.add_argument(
+    "--alert-coalesce-seconds",
+    type=float,
+    default=5.0,
+    help="Suppress repeat price alerts for the same ticker and direction within this window "
+    "in websocket mode (default: 5, 0 = send every alert)",
+)
+_PARSER.add_argument(
+    "--tickers",
+    nargs="+",
+    default=None,
+    help="Specific tickers to monitor (default: all from config)",
+)
 
 
 def main():
@@ -257,7 +435,7 @@ def main():
     try:
         config_loader = ConfigLoader()
         stocks = config_loader.load_stocks()
-        tickers = [stock.ticker for stock in stocks]
+        tickers = list(map(attrgetter("ticker"), stocks))
 
         logger.info(f"Loaded {len(tickers)} tickers from config")
         logger.info(f"Tickers: {', '.join(tickers)}")
@@ -287,42 +465,17 @@ def main():
     discord_webhook = os.getenv("DISCORD_WEBHOOK_URL")
     if discord_webhook:
         try:
-            notifier = DiscordNotifier(discord_webhook)
+            notifier = get_notifier(discord_webhook)
             logger.info("Discord notifier initialized")
         except Exception as e:
             logger.warning(f"Discord notifier not available: {e}")
 
     # Parse command line arguments
-    import argparse
-
-    parser = argparse.ArgumentParser(description="Collect US stock market prices")
-    parser.add_argument(
-        "--mode",
-        choices=["snapshot", "websocket", "polling"],
-        default="websocket",
-        help="Collection mode (default: websocket)",
-    )
-    parser.add_argument(
-        "--interval",
-        type=int,
-        default=5,
-        help="Poll interval in seconds for polling mode (default: 5)",
-    )
-    parser.add_argument(
-        "--duration", type=int, default=None, help="Duration in minutes (default: indefinite)"
-    )
-    parser.add_argument(
-        "--tickers",
-        nargs="+",
-        default=None,
-        help="Specific tickers to monitor (default: all from config)",
-    )
-
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
     # Override tickers if specified
     if args.tickers:
-        tickers = [t.upper() for t in args.tickers]
+        tickers = list(map(str.upper, args.tickers))
         logger.info(f"Using specified tickers: {', '.join(tickers)}")
 
     # Run collection
@@ -331,7 +484,9 @@ def main():
             collect_snapshot(collector, tickers)
 
         elif args.mode == "websocket":
-            collect_websocket(collector, tickers, args.duration, notifier)
+            collect_websocket(
+                collector, tickers, args.duration, notifier, args.alert_coalesce_seconds
+            )
 
         elif args.mode == "polling":
             collect_polling(collector, tickers, args.interval, args.duration)
@@ -339,11 +494,8 @@ def main():
     except KeyboardInterrupt:
         logger.info("\nCollection stopped by user")
 
-    except Exception as e:
-        logger.error(f"Collection error: {e}")
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Collection error")
         sys.exit(1)
 
     logger.info("\nCollection completed successfully")
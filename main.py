@@ -7,6 +7,10 @@ Main entry point for the trading signal generation system.
 
 import os
 import sys
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from itertools import islice
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -16,15 +20,14 @@ from loguru import logger
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.analysis.backtester import run_daily_backtest
-from src.analysis.llm_agent import LLMAgent
-from src.data.news_collector import MassiveNewsCollector
-from src.data.price_collector import FinnhubPriceCollector
-from src.notification.discord_notifier import DiscordNotifier
+from src.notification.discord_notifier import get_notifier
+from src.notification.notification_queue import NotificationQueue
 from src.pipeline.position_tracker import PositionTracker
 from src.pipeline.scheduler import TradingScheduler
+from src.pipeline.shared_cache import SharedMarketCache
 from src.pipeline.signal_manager import SignalManager
-from src.utils.config_loader import ConfigLoader, load_stocks
+from src.utils.config_loader import get_config_loader, load_stocks
+from src.utils.file_cache import FileCache
 
 
 class TradingPipeline:
@@ -46,26 +49,41 @@ class TradingPipeline:
             openai_api_key: OpenAI API 키
             discord_webhook_url: Discord 웹훅 URL
         """
+        # API 클라이언트(openai/finnhub/massive)는 파이프라인을 만들 때만 로드
+        from src.analysis.llm_agent import LLMAgent
+        from src.data.news_collector import MassiveNewsCollector
+        from src.data.price_collector import FinnhubPriceCollector
+
         # 파이프라인 설정 로드
-        config_loader = ConfigLoader()
+        config_loader = get_config_loader()
         self.pipeline_config = config_loader.load_pipeline_config()
 
         # 모니터링할 종목 로드
         self.stocks = load_stocks()
-        self.tickers = [stock["ticker"] for stock in self.stocks]
+        self.tickers: tuple[str, ...] = tuple(map(itemgetter("ticker"), self.stocks))
 
         logger.info(f"모니터링 종목 {len(self.tickers)}개: {', '.join(self.tickers)}")
 
-        # 컴포넌트 초기화
-        self.news_collector = MassiveNewsCollector(api_key=massive_api_key)
-        self.price_collector = FinnhubPriceCollector(api_key=finnhub_api_key)
-        self.llm_agent = LLMAgent(api_key=openai_api_key)
+        # 컴포넌트 초기화 (반복 실행 시 최근 응답은 디스크 캐시에서 재사용)
+        self.api_cache = FileCache(project_root / "data" / "cache")
+        self.news_collector = MassiveNewsCollector(api_key=massive_api_key, cache=self.api_cache)
+        self.price_collector = FinnhubPriceCollector(api_key=finnhub_api_key, cache=self.api_cache)
+        # 워크플로우/알림이 같은 시세 조회를 공유하도록 메모리 캐시를 앞단에 둠
+        self.market_cache = SharedMarketCache(
+            self.price_collector,
+            ttl_seconds=config_loader.get_constant("price_collector.memory_ttl_seconds", 60),
+        )
+        self.llm_agent = LLMAgent(api_key=openai_api_key, cache=self.api_cache)
         self.signal_manager = SignalManager()
         self.position_tracker = PositionTracker()
-        self.discord = DiscordNotifier(webhook_url=discord_webhook_url)
+        self.discord = get_notifier(discord_webhook_url)
+        # 종목별 실시간 알림은 백그라운드 스레드에서 순서대로 전송
+        self.signal_queue = NotificationQueue(self.discord, coalesce_seconds=0)
 
-        # 가격 비교를 위한 캐시
-        self.previous_prices: dict[str, float] = {}
+        # 가격 비교를 위한 캐시 (읽기 전용, 실행마다 참조만 교체)
+        self.previous_prices: Mapping[str, float] = {}
+        # 직전 실시간 분석의 뉴스 해시 (같은 뉴스 재분석 방지)
+        self.last_news_hash: bytes | None = None
 
         logger.success("트레이딩 파이프라인 초기화 완료")
 
@@ -75,7 +93,7 @@ class TradingPipeline:
 
         workflow = PreMarketAnalysisWorkflow(
             news_collector=self.news_collector,
-            price_collector=self.price_collector,
+            price_collector=self.market_cache,
             llm_agent=self.llm_agent,
             signal_manager=self.signal_manager,
             position_tracker=self.position_tracker,
@@ -91,18 +109,25 @@ class TradingPipeline:
 
         workflow = RealtimeAnalysisWorkflow(
             news_collector=self.news_collector,
-            price_collector=self.price_collector,
+            price_collector=self.market_cache,
             llm_agent=self.llm_agent,
             signal_manager=self.signal_manager,
             position_tracker=self.position_tracker,
             discord_notifier=self.discord,
             tickers=self.tickers,
             pipeline_config=self.pipeline_config,
-            previous_prices=self.previous_prices.copy() if self.previous_prices else None,
+            previous_prices=self.previous_prices or None,
+            previous_news_hash=self.last_news_hash,
+            signal_notifier=self.signal_queue,
         )
         workflow.run()
 
-        # 가격 캐시 업데이트
+        # 분석을 완료한 경우에만 뉴스 해시 갱신
+        news_hash = workflow.get_news_hash()
+        if news_hash:
+            self.last_news_hash = news_hash
+
+        # 가격 캐시 업데이트 (워크플로우가 매번 새 dict를 만들므로 복사 없이 참조 교체)
         current_prices = workflow.get_current_prices()
         if current_prices:
             self.previous_prices = current_prices
@@ -116,15 +141,24 @@ class TradingPipeline:
         2. 오늘의 시그널로 백테스팅 실행
         3. 결과를 Discord로 전송
         """
+        from src.analysis.backtester import find_signal_files, run_daily_backtest
+
         logger.info("=" * 70)
         logger.info("📊 장후 백테스팅")
         logger.info("=" * 70)
 
+        # 오늘 시그널이 없으면 (휴장일 등) 종가 조회 없이 바로 종료
+        if not find_signal_files(self.signal_manager.signals_dir, datetime.now(UTC)):
+            logger.warning("오늘 시그널 없음 - 백테스팅 생략")
+            return
+
         try:
             # 1. 장 마감 가격 조회
             logger.info("장 마감 가격 조회 중...")
-            quotes = self.price_collector.get_quotes(self.tickers)
-            closing_prices = {ticker: quote.current_price for ticker, quote in quotes.items()}
+            quotes = self.market_cache.get_quotes(self.tickers)
+            closing_prices = dict(
+                zip(quotes.keys(), map(attrgetter("current_price"), quotes.values()), strict=True)
+            )
 
             logger.info(f"{len(closing_prices)}개 종목 가격 조회 완료")
 
@@ -142,29 +176,30 @@ class TradingPipeline:
             # 3. Discord 알림 전송
             logger.info("백테스팅 결과를 Discord로 전송 중...")
 
-            # 실현 거래 통계
-            buy_count = sum(1 for t in result.trades if t.action == "buy")
-            sell_count = sum(1 for t in result.trades if t.action == "sell")
+            # 실현 거래 통계 (거래 목록을 한 번만 순회)
+            buy_tickers: list[str] = []
+            sell_tickers: list[str] = []
+            for trade in result.trades:
+                if trade.action == "buy":
+                    buy_tickers.append(trade.ticker)
+                elif trade.action == "sell":
+                    sell_tickers.append(trade.ticker)
+            buy_count = len(buy_tickers)
+            sell_count = len(sell_tickers)
 
             # 보유 종목 리스트
             held_tickers = (
                 list(result.positions_at_close.keys()) if result.positions_at_close else []
             )
 
-            # 최고/최악 거래
-            result.best_trade["ticker"] if result.best_trade else None
-            result.best_trade["pnl_pct"] if result.best_trade else None
-            result.worst_trade["ticker"] if result.worst_trade else None
-            result.worst_trade["pnl_pct"] if result.worst_trade else None
-
             self.discord.send_postmarket_summary(
                 total_signals=buy_count + sell_count,
                 buy_count=buy_count,
                 sell_count=sell_count,
                 hold_count=len(held_tickers),
                 breaking_signals=0,  # 실시간 시그널 개수 (별도 추적 필요)
-                buy_tickers=[t.ticker for t in result.trades if t.action == "buy"],
-                sell_tickers=[t.ticker for t in result.trades if t.action == "sell"],
+                buy_tickers=buy_tickers,
+                sell_tickers=sell_tickers,
                 virtual_return=result.total_return_pct,
             )
 
@@ -174,10 +209,7 @@ class TradingPipeline:
             logger.success("✓ 장후 백테스팅 완료")
 
         except Exception as e:
-            logger.error(f"🚨 장후 백테스팅 실패: {e}")
-            import traceback
-
-            traceback.print_exc()
+            logger.exception(f"🚨 장후 백테스팅 실패: {e}")
 
             # 에러 알림 전송
             self.discord.send_error(
@@ -194,65 +226,95 @@ class TradingPipeline:
             result: BacktestResult 객체
         """
 
-        content = "━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        content += "💰 **백테스팅 상세 결과**\n"
-        content += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+        divider = "━" * 26
+        lines = [
+            divider,
+            "💰 **백테스팅 상세 결과**",
+            divider,
+            "",
+        ]
 
         # 총 수익률 (확신도 기반 금액 투자)
         emoji = "📈" if result.total_return_pct > 0 else "📉"
-        content += f"{emoji} **총 수익률**\n\n"
-        content += f"**{result.total_return_pct:+.2f}%** `${result.total_return_usd:+,.2f}`\n\n"
-        content += "📊 투자 내역\n"
-        content += f"   ├─ 총 투자: ${result.total_invested:,.0f}\n"
-        content += f"   ├─ 매도 수익: ${result.total_proceeds:,.0f}\n"
-        content += f"   └─ 최종 가치: ${result.total_value:,.0f}\n\n"
+        lines += [
+            f"{emoji} **총 수익률**",
+            "",
+            f"**{result.total_return_pct:+.2f}%** `${result.total_return_usd:+,.2f}`",
+            "",
+            "📊 투자 내역",
+            f"   ├─ 총 투자: ${result.total_invested:,.0f}",
+            f"   ├─ 매도 수익: ${result.total_proceeds:,.0f}",
+            f"   └─ 최종 가치: ${result.total_value:,.0f}",
+            "",
+        ]
 
         # 거래 통계
-        content += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        content += "📊 **거래 통계**\n\n"
-        content += f"총 거래: {len(result.trades)}회\n"
-        content += f"   ├─ ✅ 수익: {result.winning_trades}회\n"
-        content += f"   └─ ❌ 손실: {result.losing_trades}회\n"
-        content += f"\n승률: **{result.win_rate:.1f}%**\n\n"
+        lines += [
+            divider,
+            "📊 **거래 통계**",
+            "",
+            f"총 거래: {len(result.trades)}회",
+            f"   ├─ ✅ 수익: {result.winning_trades}회",
+            f"   └─ ❌ 손실: {result.losing_trades}회",
+            "",
+            f"승률: **{result.win_rate:.1f}%**",
+            "",
+        ]
 
         # 최고/최악 거래
         if result.best_trade or result.worst_trade:
-            content += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            content += "🎯 **주요 거래**\n\n"
+            lines += [divider, "🎯 **주요 거래**", ""]
 
             if result.best_trade:
                 best = result.best_trade
-                content += "🏆 최고 거래\n"
-                content += f"**{best['ticker']}** {best['pnl_pct']:+.2f}% `${best['pnl']:+.2f}`\n\n"
+                lines += [
+                    "🏆 최고 거래",
+                    f"**{best['ticker']}** {best['pnl_pct']:+.2f}% `${best['pnl']:+.2f}`",
+                    "",
+                ]
 
             if result.worst_trade:
                 worst = result.worst_trade
-                content += "⚠️ 최악 거래\n"
-                content += (
-                    f"**{worst['ticker']}** {worst['pnl_pct']:+.2f}% `${worst['pnl']:+.2f}`\n\n"
-                )
+                lines += [
+                    "⚠️ 최악 거래",
+                    f"**{worst['ticker']}** {worst['pnl_pct']:+.2f}% `${worst['pnl']:+.2f}`",
+                    "",
+                ]
 
         # 보유 포지션
         if result.positions_at_close:
-            content += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            content += f"📦 **보유 종목** ({len(result.positions_at_close)}개)\n\n"
-            for ticker, pos in list(result.positions_at_close.items())[:5]:
+            lines += [divider, f"📦 **보유 종목** ({len(result.positions_at_close)}개)", ""]
+            for ticker, pos in islice(result.positions_at_close.items(), 5):
                 pnl_emoji = "📈" if pos["pnl"] > 0 else "📉"
-                content += f"**{ticker}** {pnl_emoji}\n"
-                content += f"`{pos['pnl_pct']:+.2f}%` ${pos['pnl']:+,.2f}\n\n"
+                lines += [
+                    f"**{ticker}** {pnl_emoji}",
+                    f"`{pos['pnl_pct']:+.2f}%` ${pos['pnl']:+,.2f}",
+                    "",
+                ]
 
             if len(result.positions_at_close) > 5:
-                content += f"...외 {len(result.positions_at_close) - 5}개\n\n"
+                lines += [f"...외 {len(result.positions_at_close) - 5}개", ""]
 
-            content += f"💵 미실현 손익: **${result.unrealized_pnl:+,.2f}**\n\n"
+            lines += [f"💵 미실현 손익: **${result.unrealized_pnl:+,.2f}**", ""]
 
-        content += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        content += "💡 투자 방식: 시그널당 $1,000 × 확신도\n"
-        content += "⚠️ 가상 백테스팅 결과 (참고용)"
+        lines += [
+            divider,
+            "💡 투자 방식: 시그널당 $1,000 × 확신도",
+            "⚠️ 가상 백테스팅 결과 (참고용)",
+        ]
+        content = "\n".join(lines)
 
         # Discord 전송
         self.discord._send_message(content=content)
 
+    def close(self) -> None:
+        """대기 중인 알림을 모두 전송하고 HTTP 연결 정리"""
+        self.signal_queue.close()
+        self.news_collector.close()
+        self.price_collector.close()
+        # 오래된 디스크 캐시 파일 정리
+        self.api_cache.prune()
+
 
 def main():
     """메인 진입점"""
@@ -322,10 +384,7 @@ def main():
             logger.warning(f"종료 알림 전송 실패: {e}")
 
     except Exception as e:
-        logger.error(f"파이프라인 에러: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"파이프라인 에러: {e}")
 
         # 에러 종료 알림 전송
         try:
@@ -339,6 +398,9 @@ def main():
 
         sys.exit(1)
 
+    finally:
+        pipeline.close()
+
 
 if __name__ == "__main__":
     main()
@@ -4,7 +4,6 @@ News Analysis Module
 GPT-4o mini powered news analysis and signal generation.
 """
 
-from .llm_agent import LLMAgent
 from .models import AnalysisResult, RiskLevel, TradingSignal
 from .prompt_templates import PromptTemplates
 
@@ -15,3 +14,12 @@ __all__ = [
     "LLMAgent",
     "PromptTemplates",
 ]
+
+
+def __getattr__(name):
+    """Lazy import so the models can be used without loading the OpenAI client."""
+    if name == "LLMAgent":
+        from .llm_agent import LLMAgent
+
+        return LLMAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,16 +5,25 @@ Backtester
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from operator import itemgetter
 from pathlib import Path
 
 from loguru import logger
 
-from ..utils.config_loader import ConfigLoader
+from ..utils.config_loader import ConfigLoader, get_config_loader
 
+try:
+    # 선택 의존성: orjson이 설치되어 있으면 시그널 파일 파싱에 사용 (표준 json보다 빠름)
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Trade:
     """거래 기록"""
 
@@ -28,7 +37,7 @@ class Trade:
     investment_amount: float  # 투자 금액
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     """백테스팅 결과"""
 
@@ -62,11 +71,11 @@ class Backtester:
         Args:
             base_investment_per_signal: 시그널당 기본 투자 금액 (None = config에서 로드)
             commission: 거래 수수료 비율 (None = config에서 로드)
-            config_loader: Optional config loader (creates new one if not provided)
+            config_loader: Optional config loader (uses the shared default if not provided)
         """
         # Load from config if not provided
         if config_loader is None:
-            config_loader = ConfigLoader()
+            config_loader = get_config_loader()
 
         if base_investment_per_signal is None:
             base_investment_per_signal = config_loader.get_constant(
@@ -78,14 +87,28 @@ class Backtester:
         self.base_investment = base_investment_per_signal
         self.commission = commission
 
+        # 액션별 처리 함수 (hold 등 그 외 액션은 거래 없음)
+        self._handlers = {"buy": self._process_buy, "sell": self._process_sell}
+
+        self.reset()
+
+        logger.info(f"백테스터 초기화: 시그널당 기본투자 ${base_investment_per_signal:,.0f}")
+
+    def reset(self) -> None:
+        """
+        시뮬레이션 상태 초기화 (설정은 유지)
+
+        이전 결과가 참조하는 거래 목록은 건드리지 않도록 새 컨테이너로 교체
+        """
         # 시뮬레이션 상태 (무제한 자본 가정)
         self.portfolio: dict[str, dict] = {}  # {ticker: {shares, avg_price, investment_amount}}
         self.trades: list[Trade] = []
+        # 보유 중인 종목의 매수 거래 / 청산된 (매수, 매도) 쌍 - finalize에서 재탐색하지 않도록 유지
+        self._open_buys: dict[str, Trade] = {}
+        self._closed_pairs: list[tuple[Trade, Trade]] = []
         self.total_invested = 0.0  # 총 투자 금액
         self.total_proceeds = 0.0  # 총 매도 수익
 
-        logger.info(f"백테스터 초기화: 시그널당 기본투자 ${base_investment_per_signal:,.0f}")
-
     def process_signal(
         self,
         ticker: str,
@@ -109,15 +132,11 @@ class Backtester:
         Returns:
             거래가 발생하면 Trade 객체, 아니면 None
         """
-        if action == "hold":
+        handler = self._handlers.get(action)
+        if handler is None:
             return None
 
-        if action == "buy":
-            return self._process_buy(ticker, price, confidence, timestamp, reasoning)
-        elif action == "sell":
-            return self._process_sell(ticker, price, confidence, timestamp, reasoning)
-
-        return None
+        return handler(ticker, price, confidence, timestamp, reasoning)
 
     def _process_buy(
         self,
@@ -130,7 +149,8 @@ class Backtester:
         """매수 처리 (무제한 자본, 확신도 기반 금액 투자)"""
         # 이미 보유 중이면 추가 매수 안 함 (단순화)
         if ticker in self.portfolio:
-            logger.debug(f"{ticker} 이미 보유 중 - 추가 매수 생략")
+            # 시그널마다 호출되는 로그는 인자 전달 방식으로 남겨, 출력될 때만 포맷팅
+            logger.debug("{} 이미 보유 중 - 추가 매수 생략", ticker)
             return None
 
         # 투자 금액 = 기본 투자금 × 확신도
@@ -164,9 +184,15 @@ class Backtester:
             investment_amount=cost,
         )
         self.trades.append(trade)
+        self._open_buys[ticker] = trade
 
         logger.info(
-            f"매수: {ticker} ${cost:,.2f} (= {shares:.4f}주 × ${price:.2f}, 확신도 {confidence:.1%})"
+            "매수: {} ${:,.2f} (= {:.4f}주 × ${:.2f}, 확신도 {:.1%})",
+            ticker,
+            cost,
+            shares,
+            price,
+            confidence,
         )
 
         return trade
@@ -182,7 +208,7 @@ class Backtester:
         """매도 처리"""
         # 보유하지 않은 종목은 매도 불가
         if ticker not in self.portfolio:
-            logger.debug(f"{ticker} 미보유 - 매도 생략")
+            logger.debug("{} 미보유 - 매도 생략", ticker)
             return None
 
         position = self.portfolio[ticker]
@@ -212,10 +238,16 @@ class Backtester:
             investment_amount=proceeds,
         )
         self.trades.append(trade)
+        self._closed_pairs.append((self._open_buys.pop(ticker), trade))
 
         logger.info(
-            f"매도: {ticker} {shares:.4f}주 @ ${price:.2f} "
-            f"(수익: ${pnl:+,.2f} / {pnl_pct:+.2f}%, 투자액: ${investment_amount:,.2f})"
+            "매도: {} {:.4f}주 @ ${:.2f} (수익: ${:+,.2f} / {:+.2f}%, 투자액: ${:,.2f})",
+            ticker,
+            shares,
+            price,
+            pnl,
+            pnl_pct,
+            investment_amount,
         )
 
         return trade
@@ -230,21 +262,49 @@ class Backtester:
         Returns:
             미실현 손익 (USD)
         """
-        unrealized = 0.0
+        _, _, unrealized_pnl = self._evaluate_positions(current_prices)
+        return unrealized_pnl
+
+    def _evaluate_positions(self, prices: dict[str, float]) -> tuple[dict[str, dict], float, float]:
+        """
+        보유 포지션을 한 번 순회하며 평가
+
+        Args:
+            prices: 평가 가격 딕셔너리
+
+        Returns:
+            (종목별 포지션 평가, 총 시장 가치, 미실현 손익)
+        """
+        positions = {}
+        total_market_value = 0.0
+        unrealized_pnl = 0.0
 
         for ticker, position in self.portfolio.items():
-            if ticker not in current_prices:
-                logger.warning(f"{ticker} 현재 가격 없음 - 미실현 손익 계산 생략")
+            current_price = prices.get(ticker)
+            if current_price is None:
+                logger.warning("{} 현재 가격 없음 - 미실현 손익 계산 생략", ticker)
                 continue
 
-            current_price = current_prices[ticker]
             shares = position["shares"]
-            avg_price = position["avg_price"]
-
-            pnl = (current_price - avg_price) * shares
-            unrealized += pnl
-
-        return unrealized
+            investment_amount = position["investment_amount"]
+
+            # 현재 시장 가치와 미실현 손익 (수수료 포함 투자금 대비)
+            market_value = shares * current_price
+            pnl = market_value - investment_amount
+            total_market_value += market_value
+            unrealized_pnl += pnl
+
+            positions[ticker] = {
+                "shares": shares,
+                "avg_price": position["avg_price"],
+                "investment_amount": investment_amount,
+                "current_price": current_price,
+                "market_value": market_value,
+                "pnl": pnl,
+                "pnl_pct": (pnl / investment_amount) * 100,
+            }
+
+        return positions, total_market_value, unrealized_pnl
 
     def finalize(self, closing_prices: dict[str, float]) -> BacktestResult:
         """
@@ -257,35 +317,9 @@ class Backtester:
             백테스팅 결과
         """
         # 보유 포지션 평가
-        positions_at_close = {}
-        unrealized_total_value = 0.0
-        unrealized_pnl = 0.0
-
-        for ticker, position in self.portfolio.items():
-            if ticker in closing_prices:
-                current_price = closing_prices[ticker]
-                shares = position["shares"]
-                investment_amount = position["investment_amount"]
-                avg_price = position["avg_price"]
-
-                # 현재 시장 가치
-                market_value = shares * current_price
-                unrealized_total_value += market_value
-
-                # 미실현 손익
-                pnl = market_value - investment_amount
-                unrealized_pnl += pnl
-                pnl_pct = (pnl / investment_amount) * 100
-
-                positions_at_close[ticker] = {
-                    "shares": shares,
-                    "avg_price": avg_price,
-                    "investment_amount": investment_amount,
-                    "current_price": current_price,
-                    "market_value": market_value,
-                    "pnl": pnl,
-                    "pnl_pct": pnl_pct,
-                }
+        positions_at_close, unrealized_total_value, unrealized_pnl = self._evaluate_positions(
+            closing_prices
+        )
 
         # 최종 가치 = 매도 수익 + 보유 포지션 시장가
         total_value = self.total_proceeds + unrealized_total_value
@@ -296,53 +330,29 @@ class Backtester:
             (total_return_usd / self.total_invested * 100) if self.total_invested > 0 else 0.0
         )
 
+        # 매수-매도 쌍 (매도 시점에 기록된 쌍 사용)
+        closed_trades = []
+        for buy_trade, trade in self._closed_pairs:
+            # 실제 투자금액 대비 수익
+            pnl = trade.investment_amount - buy_trade.investment_amount
+            closed_trades.append(
+                {
+                    "ticker": trade.ticker,
+                    "buy_price": buy_trade.price,
+                    "sell_price": trade.price,
+                    "shares": trade.shares,
+                    "investment": buy_trade.investment_amount,
+                    "proceeds": trade.investment_amount,
+                    "pnl": pnl,
+                    "pnl_pct": (pnl / buy_trade.investment_amount) * 100,
+                }
+            )
+
         # 거래 분석
-        winning_trades = 0
-        losing_trades = 0
-        best_trade = None
-        worst_trade = None
-        best_pnl = float("-inf")
-        worst_pnl = float("inf")
-
-        # 매수-매도 쌍 찾기
-        buy_trades = {t.ticker: t for t in self.trades if t.action == "buy"}
-        for trade in self.trades:
-            if trade.action == "sell" and trade.ticker in buy_trades:
-                buy_trade = buy_trades[trade.ticker]
-                # 실제 투자금액 대비 수익
-                pnl = trade.investment_amount - buy_trade.investment_amount
-                pnl_pct = (pnl / buy_trade.investment_amount) * 100
-
-                if pnl > 0:
-                    winning_trades += 1
-                else:
-                    losing_trades += 1
-
-                if pnl > best_pnl:
-                    best_pnl = pnl
-                    best_trade = {
-                        "ticker": trade.ticker,
-                        "buy_price": buy_trade.price,
-                        "sell_price": trade.price,
-                        "shares": trade.shares,
-                        "investment": buy_trade.investment_amount,
-                        "proceeds": trade.investment_amount,
-                        "pnl": pnl,
-                        "pnl_pct": pnl_pct,
-                    }
-
-                if pnl < worst_pnl:
-                    worst_pnl = pnl
-                    worst_trade = {
-                        "ticker": trade.ticker,
-                        "buy_price": buy_trade.price,
-                        "sell_price": trade.price,
-                        "shares": trade.shares,
-                        "investment": buy_trade.investment_amount,
-                        "proceeds": trade.investment_amount,
-                        "pnl": pnl,
-                        "pnl_pct": pnl_pct,
-                    }
+        winning_trades = sum(1 for closed in closed_trades if closed["pnl"] > 0)
+        losing_trades = len(closed_trades) - winning_trades
+        best_trade = max(closed_trades, key=itemgetter("pnl"), default=None)
+        worst_trade = min(closed_trades, key=itemgetter("pnl"), default=None)
 
         total_closed_trades = winning_trades + losing_trades
         win_rate = (winning_trades / total_closed_trades * 100) if total_closed_trades > 0 else 0.0
@@ -373,6 +383,60 @@ class Backtester:
         return result
 
 
+def find_signal_files(signals_dir: Path, date: datetime) -> list[str]:
+    """
+    특정 날짜의 시그널 파일 경로를 시간순으로 반환
+
+    디렉토리를 한 번만 읽고 파일 이름 접두사로 거르므로, 여러 날의 파일이
+    쌓여 있어도 파일마다 Path를 만들거나 stat을 호출하지 않음
+
+    Args:
+        signals_dir: 시그널 파일 디렉토리
+        date: 찾을 날짜
+
+    Returns:
+        시그널 파일 경로 리스트 (없으면 빈 리스트)
+    """
+    prefix = f"signals_{date.strftime('%Y%m%d')}_"
+    try:
+        with os.scandir(signals_dir) as entries:
+            return sorted(
+                entry.path
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(".json")
+            )
+    except FileNotFoundError:
+        return []
+
+
+# (종목, 액션, 가격, 신뢰도, 분석 이유)
+_ReplaySignal = tuple[str, str, float | None, float, str]
+
+
+def _load_signal_file(path: str) -> tuple[datetime, list[_ReplaySignal]]:
+    """
+    시그널 파일 하나를 읽어 (생성 시각, 재생할 시그널) 반환
+
+    백테스트에 쓰는 필드만 남기고 hold 시그널은 제외하므로, key_points 등
+    나머지 파싱 결과는 모든 파일을 모으기 전에 바로 해제됨
+    """
+    with open(path, "rb") as f:
+        data = _json_loads(f.read())
+
+    signals = [
+        (
+            ticker,
+            action,
+            signal.get("price"),
+            signal.get("confidence", 0.0),
+            signal.get("reasoning", ""),
+        )
+        for ticker, signal in data.get("signals", {}).items()
+        if (action := signal.get("action")) != "hold"
+    ]
+    return datetime.fromisoformat(data.get("generated_at")), signals
+
+
 def run_daily_backtest(
     signals_dir: Path,
     current_prices: dict[str, float],
@@ -394,7 +458,7 @@ def run_daily_backtest(
 
     # 오늘 날짜의 시그널 파일 찾기
     date_str = date.strftime("%Y%m%d")
-    signal_files = sorted(signals_dir.glob(f"signals_{date_str}_*.json"))
+    signal_files = find_signal_files(signals_dir, date)
 
     if not signal_files:
         logger.warning(f"{date_str} 날짜의 시그널 파일 없음")
@@ -402,29 +466,22 @@ def run_daily_backtest(
 
     logger.info(f"{len(signal_files)}개의 시그널 파일 발견")
 
-    # 백테스터 초기화
+    # 실행마다 새로 만들어 trading_rules.yaml 수정 사항이 재시작 없이 반영되도록 함
     backtester = Backtester()
 
-    # 모든 시그널 처리 (시간순)
-    for signal_file in signal_files:
-        with open(signal_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-        signals = data.get("signals", {})
-        timestamp = datetime.fromisoformat(data.get("generated_at"))
-
-        for ticker, signal in signals.items():
-            action = signal.get("action")
-            confidence = signal.get("confidence", 0.0)
-            reasoning = signal.get("reasoning", "")
-            price = signal.get("price")
+    # 시그널 파일은 병렬로 읽고 파싱, 백테스터(상태 보유)는 한 스레드에서 시간순으로 처리
+    with ThreadPoolExecutor(max_workers=min(8, len(signal_files))) as executor:
+        signal_batches = sorted(executor.map(_load_signal_file, signal_files), key=itemgetter(0))
 
+    # 모든 시그널 처리 (생성 시각순)
+    for timestamp, signals in signal_batches:
+        for ticker, action, price, confidence, reasoning in signals:
             # 가격 정보가 없으면 현재 가격 사용 (폴백)
             if price is None:
                 price = current_prices.get(ticker)
 
             if price is None:
-                logger.warning(f"{ticker} 가격 정보 없음 - 시그널 생략")
+                logger.warning("{} 가격 정보 없음 - 시그널 생략", ticker)
                 continue
 
             # 시그널 처리
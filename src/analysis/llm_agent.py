@@ -4,14 +4,24 @@ LLM Agent
 OpenAI GPT-4o mini integration for news analysis.
 """
 
+import hashlib
 import json
+import re
+import threading
+import time
 import uuid
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 
 from loguru import logger
 from openai import OpenAI
+from pydantic import ValidationError
 
-from ..utils.config_loader import ConfigLoader
+from ..data.models import NewsArticle
+from ..utils.config_loader import ConfigLoader, get_config_loader
+from ..utils.file_cache import FileCache
 from .models import AnalysisResult, RiskLevel, TickerAnalysis, TradingSignal
 from .prompt_templates import PromptTemplates
 
@@ -26,6 +36,7 @@ class LLMAgent:
         max_tokens: int = 4096,
         temperature: float = 0.1,
         config_loader: ConfigLoader | None = None,
+        cache: FileCache | None = None,
     ):
         """Initialize LLM agent.
 
@@ -34,7 +45,8 @@ class LLMAgent:
             model: Model name (default: gpt-4o-mini)
             max_tokens: Maximum tokens in response
             temperature: Temperature for sampling (lower = more deterministic)
-            config_loader: Optional config loader (creates new one if not provided)
+            config_loader: Optional config loader (uses the shared default if not provided)
+            cache: Optional disk cache for analysis results (disabled if not provided)
         """
         self.client = OpenAI(api_key=api_key)
         self.model = model
@@ -43,7 +55,7 @@ class LLMAgent:
 
         # Load token pricing from config
         if config_loader is None:
-            config_loader = ConfigLoader()
+            config_loader = get_config_loader()
 
         self.COST_PER_1M_INPUT_TOKENS = config_loader.get_constant(
             "llm_pricing.cost_per_1m_input_tokens", 0.15
@@ -51,22 +63,48 @@ class LLMAgent:
         self.COST_PER_1M_OUTPUT_TOKENS = config_loader.get_constant(
             "llm_pricing.cost_per_1m_output_tokens", 0.60
         )
+        # Batch API jobs are billed at a discount on both input and output tokens
+        self.BATCH_COST_MULTIPLIER = config_loader.get_constant(
+            "llm_pricing.batch_cost_multiplier", 0.5
+        )
+
+        # Response caches: an identical prompt (exact hash) or, with the same
+        # prices/watchlist/mode context, a news set whose titles barely changed
+        # since a recent call reuses that call's result instead of hitting the API
+        self.CACHE_TTL_SECONDS = config_loader.get_constant("llm_cache.ttl_minutes", 15) * 60
+        self.CACHE_SIMILARITY = config_loader.get_constant("llm_cache.similarity_threshold", 0.95)
+        self.CACHE_MAX_ENTRIES = config_loader.get_constant("llm_cache.max_entries", 16)
+        self._prompt_cache: OrderedDict[bytes, tuple[float, AnalysisResult]] = OrderedDict()
+        self._response_cache: deque[tuple[bytes, frozenset[str], float, AnalysisResult]] = deque(
+            maxlen=self.CACHE_MAX_ENTRIES
+        )
+        # Optional disk cache so reruns and retries with an identical prompt
+        # skip the API call entirely (same TTL as the in-memory caches)
+        self._cache = cache
+        # Hit/miss counters for tuning the similarity threshold
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # batch_analyze runs analyze_news on several threads at once
+        self._cache_lock = threading.Lock()
+
+        # Concurrent requests in batch_analyze (bounded for OpenAI rate limits)
+        self.MAX_CONCURRENCY = config_loader.get_constant("llm_batch.max_concurrency", 4)
 
         logger.info(f"Initialized LLM agent with model: {model}")
 
     def analyze_news(
         self,
-        news_articles: list[dict],
+        news_articles: list[NewsArticle],
         current_prices: dict[str, float],
         mode: str = "pre_market",
         previous_prices: dict[str, float] | None = None,
-        watchlist: list[str] | None = None,
+        watchlist: Sequence[str] | None = None,
         **kwargs,
     ) -> AnalysisResult:
         """Analyze news articles and generate trading signals.
 
         Args:
-            news_articles: List of news articles (as dicts)
+            news_articles: List of NewsArticle objects
             current_prices: Current prices for tickers
             mode: Analysis mode ('pre_market' or 'realtime')
             previous_prices: Previous prices for comparison (realtime only)
@@ -78,37 +116,36 @@ class LLMAgent:
         """
         logger.info(f"Analyzing {len(news_articles)} articles in {mode} mode")
 
-        # Build prompt based on mode
-        if mode == "pre_market":
-            user_prompt = PromptTemplates.build_pre_market_prompt(
-                news_articles=news_articles,
-                current_prices=current_prices,
-                watchlist=watchlist,
-                **kwargs,
-            )
-        elif mode == "realtime":
-            user_prompt = PromptTemplates.build_realtime_prompt(
-                news_articles=news_articles,
-                current_prices=current_prices,
-                previous_prices=previous_prices,
-                watchlist=watchlist,
-                **kwargs,
-            )
-        else:
-            raise ValueError(f"Invalid mode: {mode}. Use 'pre_market' or 'realtime'")
+        user_prompt = self._build_user_prompt(
+            news_articles, current_prices, mode, previous_prices, watchlist, **kwargs
+        )
+
+        # The prompt already carries everything that shapes the answer (news,
+        # prices at 2 decimals, watchlist, mode), so its hash is the exact key
+        prompt_key = hashlib.blake2b(user_prompt.encode(), digest_size=16).digest()
+        # Near-duplicate reuse is only safe when everything but the news is
+        # identical, so that part of the prompt (built without news) is its key
+        context_prompt = self._build_user_prompt(
+            [], current_prices, mode, previous_prices, watchlist, **kwargs
+        )
+        context_key = hashlib.blake2b(context_prompt.encode(), digest_size=16).digest()
+        digest = self._news_digest(news_articles)
+        with self._cache_lock:
+            cached = self._get_cached_result(prompt_key, context_key, digest, news_articles)
+        if cached is None:
+            cached = self._get_disk_cached_result(prompt_key, news_articles)
+        with self._cache_lock:
+            if cached is not None:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+        if cached is not None:
+            logger.debug(f"LLM cache hit rate: {self.cache_hit_rate:.1%}")
+            return cached
 
         # Call OpenAI API
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": PromptTemplates.SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                response_format={"type": "json_object"},  # Ensure JSON output
-            )
+            response = self.client.chat.completions.create(**self._chat_request(user_prompt))
 
             # Extract response
             content = response.choices[0].message.content
@@ -140,6 +177,21 @@ class LLMAgent:
                 f"Analysis complete. Signals: {len(result.ticker_analyses)}, Cost: ${cost_usd:.4f}"
             )
 
+            # Cache a private copy so callers mutating the returned result
+            # cannot change what later cache hits are built from
+            cached_result = result.model_copy(deep=True)
+            with self._cache_lock:
+                now = time.monotonic()
+                self._prompt_cache[prompt_key] = (now, cached_result)
+                if len(self._prompt_cache) > self.CACHE_MAX_ENTRIES:
+                    self._prompt_cache.popitem(last=False)
+                if digest:
+                    self._response_cache.append((context_key, digest, now, cached_result))
+            if self._cache is not None and self.CACHE_TTL_SECONDS > 0:
+                self._cache.set(
+                    "llm_analysis", self._disk_key(prompt_key), result.model_dump(mode="json")
+                )
+
             return result
 
         except json.JSONDecodeError as e:
@@ -151,10 +203,155 @@ class LLMAgent:
             logger.error(f"LLM analysis failed: {e}")
             raise
 
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of analyze_news calls answered from the response caches."""
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
+
+    @staticmethod
+    def _build_user_prompt(
+        news_articles: list[NewsArticle],
+        current_prices: dict[str, float],
+        mode: str,
+        previous_prices: dict[str, float] | None = None,
+        watchlist: Sequence[str] | None = None,
+        **kwargs,
+    ) -> str:
+        """Build the user prompt for the given analysis mode."""
+        if mode == "pre_market":
+            return PromptTemplates.build_pre_market_prompt(
+                news_articles=news_articles,
+                current_prices=current_prices,
+                watchlist=watchlist,
+                **kwargs,
+            )
+        if mode == "realtime":
+            return PromptTemplates.build_realtime_prompt(
+                news_articles=news_articles,
+                current_prices=current_prices,
+                previous_prices=previous_prices,
+                watchlist=watchlist,
+                **kwargs,
+            )
+        raise ValueError(f"Invalid mode: {mode}. Use 'pre_market' or 'realtime'")
+
+    def _chat_request(self, user_prompt: str) -> dict:
+        """Chat completion parameters, shared by direct calls and Batch API jobs."""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": PromptTemplates.SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "response_format": {"type": "json_object"},  # Ensure JSON output
+        }
+
+    @staticmethod
+    def _news_digest(news_articles: list[NewsArticle]) -> frozenset[str]:
+        """Reduce a news set to the lowercase words of its titles."""
+        return frozenset(
+            word for article in news_articles for word in re.findall(r"\w+", article.title.lower())
+        )
+
+    def _get_cached_result(
+        self,
+        prompt_key: bytes,
+        context_key: bytes,
+        digest: frozenset[str],
+        news_articles: list[NewsArticle],
+    ) -> AnalysisResult | None:
+        """Return a recent result for an identical prompt or near-identical news set.
+
+        The exact prompt hash is checked first. Otherwise only entries built
+        from the same non-news prompt context (mode, prices, watchlist) are
+        considered, and similarity is the Jaccard index of the title word sets.
+        Entries older than the cache TTL are ignored.
+        """
+        if self.CACHE_TTL_SECONDS <= 0:
+            return None
+
+        cutoff = time.monotonic() - self.CACHE_TTL_SECONDS
+
+        exact = self._prompt_cache.get(prompt_key)
+        if exact is not None and exact[0] >= cutoff:
+            result = exact[1]
+            logger.info(
+                f"Reusing analysis {result.analysis_id} for identical prompt - LLM call skipped"
+            )
+            return self._reuse_result(result, news_articles)
+
+        if not digest:
+            return None
+
+        for cached_context, cached_digest, cached_at, result in reversed(self._response_cache):
+            if cached_context != context_key or cached_at < cutoff:
+                continue
+
+            similarity = len(digest & cached_digest) / len(digest | cached_digest)
+            if similarity >= self.CACHE_SIMILARITY:
+                logger.info(
+                    f"Reusing analysis {result.analysis_id} for near-duplicate news set "
+                    f"(similarity {similarity:.2f}) - LLM call skipped"
+                )
+                return self._reuse_result(result, news_articles)
+
+        return None
+
+    def _disk_key(self, prompt_key: bytes) -> str:
+        """Disk cache key: the prompt hash, scoped to the model that answered it."""
+        return f"{self.model}:{prompt_key.hex()}"
+
+    def _get_disk_cached_result(
+        self, prompt_key: bytes, news_articles: list[NewsArticle]
+    ) -> AnalysisResult | None:
+        """Return a result stored on disk for an identical prompt, if still fresh."""
+        if self._cache is None or self.CACHE_TTL_SECONDS <= 0:
+            return None
+
+        data = self._cache.get(
+            "llm_analysis", self._disk_key(prompt_key), ttl=self.CACHE_TTL_SECONDS
+        )
+        if data is None:
+            return None
+
+        try:
+            result = AnalysisResult.model_validate(data)
+        except ValidationError as e:
+            logger.warning(f"Ignoring unreadable cached analysis: {e}")
+            return None
+
+        logger.info(
+            f"Reusing analysis {result.analysis_id} from disk cache for identical prompt "
+            "- LLM call skipped"
+        )
+        return self._reuse_result(result, news_articles)
+
+    @staticmethod
+    def _reuse_result(result: AnalysisResult, news_articles: list[NewsArticle]) -> AnalysisResult:
+        """Copy a cached result as a fresh, zero-cost analysis of the given news.
+
+        The copy is deep, so the caller gets its own lists and the reported
+        cost, tokens and timestamp are those of this (uncharged) call.
+        """
+        return result.model_copy(
+            deep=True,
+            update={
+                "analysis_id": str(uuid.uuid4()),
+                "timestamp": datetime.now(UTC),
+                "tokens_used": 0,
+                "cost_usd": 0.0,
+                "news_count": len(news_articles),
+                "news_ids": [article.id for article in news_articles],
+            },
+        )
+
     def _build_analysis_result(
         self,
         analysis_data: dict,
-        news_articles: list[dict],
+        news_articles: list[NewsArticle],
         tokens_used: int,
         cost_usd: float,
     ) -> AnalysisResult:
@@ -196,7 +393,7 @@ class LLMAgent:
             tokens_used=tokens_used,
             cost_usd=cost_usd,
             news_count=len(news_articles),
-            news_ids=[article.get("id", "") for article in news_articles],
+            news_ids=[article.id for article in news_articles],
         )
 
         return result
@@ -209,7 +406,7 @@ class LLMAgent:
 
     def batch_analyze(
         self,
-        news_batches: list[list[dict]],
+        news_batches: list[list[NewsArticle]],
         current_prices: dict[str, float],
         mode: str = "pre_market",
         **kwargs,
@@ -217,6 +414,8 @@ class LLMAgent:
         """Analyze multiple batches of news articles.
 
         Useful for processing large amounts of news while staying within token limits.
+        Batches are sent concurrently (up to MAX_CONCURRENCY requests in flight);
+        results keep the batch order and failed batches are skipped.
 
         Args:
             news_batches: List of news article batches
@@ -229,28 +428,177 @@ class LLMAgent:
         """
         logger.info(f"Batch analyzing {len(news_batches)} batches")
 
-        results = []
+        results_by_index: dict[int, AnalysisResult] = {}
         total_cost = 0.0
 
-        for idx, batch in enumerate(news_batches, 1):
-            logger.info(f"Processing batch {idx}/{len(news_batches)} ({len(batch)} articles)")
-
-            try:
-                result = self.analyze_news(
+        workers = max(1, min(self.MAX_CONCURRENCY, len(news_batches)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm-batch") as executor:
+            futures = {
+                executor.submit(
+                    self.analyze_news,
                     news_articles=batch,
                     current_prices=current_prices,
                     mode=mode,
                     **kwargs,
-                )
-                results.append(result)
+                ): idx
+                for idx, batch in enumerate(news_batches, 1)
+            }
+
+            # Progress is logged as batches finish, not when they are queued
+            for done, future in enumerate(as_completed(futures), 1):
+                idx = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Batch {idx} failed: {e}")
+                    continue
+
+                results_by_index[idx] = result
                 total_cost += result.cost_usd or 0.0
+                logger.info(
+                    f"Batch {idx} done ({len(news_batches[idx - 1])} articles) - "
+                    f"{done}/{len(news_batches)} finished"
+                )
+
+        results = [results_by_index[idx] for idx in sorted(results_by_index)]
+
+        logger.success(
+            f"Batch analysis complete. {len(results)}/{len(news_batches)} successful. "
+            f"Total cost: ${total_cost:.4f}"
+        )
+
+        return results
+
+    def submit_batch_job(
+        self,
+        news_batches: list[list[NewsArticle]],
+        current_prices: dict[str, float],
+        mode: str = "pre_market",
+        **kwargs,
+    ) -> str:
+        """Submit news batches as a single OpenAI Batch API job.
+
+        For runs where latency does not matter: the Batch API bills tokens at
+        a discount and finishes within 24 hours. Each batch becomes one chat
+        completion request (custom_id ``batch-{index}``); collect the results
+        with await_batch_job.
+
+        Args:
+            news_batches: List of news article batches
+            current_prices: Current prices for tickers
+            mode: Analysis mode
+            **kwargs: Additional arguments passed to prompt builder
+
+        Returns:
+            Batch job ID
+        """
+        lines = []
+        for idx, batch in enumerate(news_batches):
+            user_prompt = self._build_user_prompt(batch, current_prices, mode, **kwargs)
+            request = {
+                "custom_id": f"batch-{idx}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._chat_request(user_prompt),
+            }
+            lines.append(json.dumps(request, ensure_ascii=False))
+
+        input_file = self.client.files.create(
+            file=("news_batches.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        job = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
 
+        logger.info(f"Submitted batch job {job.id} with {len(news_batches)} requests")
+        return job.id
+
+    def await_batch_job(
+        self,
+        batch_id: str,
+        news_batches: list[list[NewsArticle]],
+        poll_seconds: float = 30.0,
+        timeout_seconds: float | None = None,
+    ) -> list[AnalysisResult]:
+        """Wait for a Batch API job and build its analysis results.
+
+        Args:
+            batch_id: Job ID returned by submit_batch_job
+            news_batches: The news batches the job was submitted with
+            poll_seconds: Interval between status checks
+            timeout_seconds: Give up after this long (None = wait indefinitely)
+
+        Returns:
+            List of AnalysisResult objects in batch order; failed requests are skipped
+
+        Raises:
+            TimeoutError: If the job is still running after timeout_seconds
+        """
+        deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+        while True:
+            job = self.client.batches.retrieve(batch_id)
+            if job.status in ("completed", "failed", "expired", "cancelled"):
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Batch job {batch_id} still {job.status} after {timeout_seconds}s"
+                )
+            logger.debug(f"Batch job {batch_id} is {job.status}, checking again in {poll_seconds}s")
+            time.sleep(poll_seconds)
+
+        # Expired or cancelled jobs may still carry the requests that finished
+        if job.output_file_id is None:
+            logger.error(f"Batch job {batch_id} ended with status {job.status} and no output")
+            return []
+
+        output = self.client.files.content(job.output_file_id).text
+        results_by_index: dict[int, AnalysisResult] = {}
+        total_cost = 0.0
+        for line in output.splitlines():
+            if not line:
+                continue
+
+            # One malformed record must not discard the rest of the (paid) job
+            custom_id = "<unknown>"
+            try:
+                record = json.loads(line)
+                custom_id = record["custom_id"]
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    logger.error(f"Batch request {custom_id} failed: {record.get('error')}")
+                    continue
+
+                idx = int(custom_id.removeprefix("batch-"))
+                if not 0 <= idx < len(news_batches):
+                    raise ValueError(f"no news batch at index {idx}")
+                body = response["body"]
+                usage = body["usage"]
+                analysis_data = json.loads(body["choices"][0]["message"]["content"])
+
+                cost_usd = (
+                    self._calculate_cost(usage["prompt_tokens"], usage["completion_tokens"])
+                    * self.BATCH_COST_MULTIPLIER
+                )
+                result = self._build_analysis_result(
+                    analysis_data=analysis_data,
+                    news_articles=news_batches[idx],
+                    tokens_used=usage["total_tokens"],
+                    cost_usd=cost_usd,
+                )
             except Exception as e:
-                logger.error(f"Batch {idx} failed: {e}")
+                logger.error(f"Failed to process batch request {custom_id}: {e!r}")
                 continue
 
+            total_cost += cost_usd
+            results_by_index[idx] = result
+
+        results = [results_by_index[idx] for idx in sorted(results_by_index)]
+
         logger.success(
-            f"Batch analysis complete. {len(results)}/{len(news_batches)} successful. "
+            f"Batch job {batch_id} {job.status}. {len(results)}/{len(news_batches)} successful. "
             f"Total cost: ${total_cost:.4f}"
         )
 
@@ -258,9 +606,9 @@ class LLMAgent:
 
     @staticmethod
     def create_news_batches(
-        news_articles: list[dict],
+        news_articles: list[NewsArticle],
         batch_size: int = 20,
-    ) -> list[list[dict]]:
+    ) -> list[list[NewsArticle]]:
         """Split news articles into batches.
 
         Args:
@@ -270,10 +618,9 @@ class LLMAgent:
         Returns:
             List of article batches
         """
-        batches = []
-        for i in range(0, len(news_articles), batch_size):
-            batch = news_articles[i : i + batch_size]
-            batches.append(batch)
+        batches = [
+            news_articles[i : i + batch_size] for i in range(0, len(news_articles), batch_size)
+        ]
 
         logger.info(f"Created {len(batches)} batches from {len(news_articles)} articles")
         return batches
@@ -7,7 +7,7 @@ Pydantic models for LLM analysis results and trading signals.
 from datetime import datetime
 from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class RiskLevel(StrEnum):
@@ -29,9 +29,17 @@ class TradingSignal(StrEnum):
     STRONG_SELL = "strong_sell"
 
 
+# Signal groups for side checks (one hash lookup instead of comparing against each member)
+BUY_SIGNALS = frozenset({TradingSignal.STRONG_BUY, TradingSignal.BUY})
+SELL_SIGNALS = frozenset({TradingSignal.STRONG_SELL, TradingSignal.SELL})
+
+
 class TickerAnalysis(BaseModel):
     """Analysis for a specific ticker."""
 
+    # Built once from the LLM response and only read afterwards
+    model_config = ConfigDict(frozen=True)
+
     ticker: str = Field(..., description="Stock ticker symbol")
     signal: TradingSignal = Field(..., description="Trading signal")
     sentiment: str = Field(..., description="Overall sentiment (positive/negative/neutral)")
@@ -89,8 +97,10 @@ class AnalysisResult(BaseModel):
     news_count: int = Field(0, description="Number of news articles analyzed")
     news_ids: list[str] = Field(default_factory=list, description="IDs of analyzed articles")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    @field_serializer("timestamp", when_used="json")
+    def serialize_datetime(self, value: datetime) -> str:
+        """Serialize timestamps with isoformat() (keeps the +00:00 offset form)."""
+        return value.isoformat()
 
     def get_ticker_analysis(self, ticker: str) -> TickerAnalysis | None:
         """Get analysis for a specific ticker."""
@@ -101,19 +111,11 @@ class AnalysisResult(BaseModel):
 
     def get_buy_signals(self) -> list[TickerAnalysis]:
         """Get all buy signals (strong_buy and buy)."""
-        return [
-            a
-            for a in self.ticker_analyses
-            if a.signal in [TradingSignal.STRONG_BUY, TradingSignal.BUY]
-        ]
+        return [a for a in self.ticker_analyses if a.signal in BUY_SIGNALS]
 
     def get_sell_signals(self) -> list[TickerAnalysis]:
         """Get all sell signals (strong_sell and sell)."""
-        return [
-            a
-            for a in self.ticker_analyses
-            if a.signal in [TradingSignal.STRONG_SELL, TradingSignal.SELL]
-        ]
+        return [a for a in self.ticker_analyses if a.signal in SELL_SIGNALS]
 
     @property
     def high_confidence_signals(self) -> list[TickerAnalysis]:
@@ -133,8 +135,8 @@ class AnalysisRequest(BaseModel):
     focus_tickers: list[str] | None = Field(None, description="Specific tickers to focus on")
     risk_tolerance: str = Field("medium", description="Risk tolerance: low/medium/high")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "mode": "pre_market",
                 "news_articles": [],
@@ -144,3 +146,4 @@ class AnalysisRequest(BaseModel):
                 "risk_tolerance": "medium",
             }
         }
+    )
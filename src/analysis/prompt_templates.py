@@ -4,6 +4,10 @@ Prompt Templates
 System and user prompts for GPT-4o mini analysis.
 """
 
+from collections.abc import Sequence
+
+from ..data.models import NewsArticle
+
 
 class PromptTemplates:
     """Prompt templates for different analysis modes."""
@@ -156,23 +160,26 @@ Return a valid JSON object with this structure:
 Respond with ONLY the JSON object, no other text."""
 
     @staticmethod
-    def format_news_summary(news_articles: list[dict]) -> str:
+    def format_news_summary(news_articles: list[NewsArticle]) -> str:
         """Format news articles for the prompt."""
         if not news_articles:
             return "No news articles available."
 
         summaries = []
         for idx, article in enumerate(news_articles, 1):
-            tickers = ", ".join(article.get("tickers", []))
-            title = article.get("title", "No title")
-            description = article.get("description", "")
-            published = article.get("published_utc", "")
+            tickers = ", ".join(article.tickers)
+            # Minute precision is all the model needs; full ISO timestamps with
+            # microseconds and offset cost extra tokens on every article
+            published = article.published_utc.strftime("%Y-%m-%d %H:%M UTC")
+            description = article.description or ""
 
             # Truncate description to save tokens
-            if description and len(description) > 200:
+            if len(description) > 200:
                 description = description[:200] + "..."
 
-            summary = f"{idx}. [{tickers}] {title}\n   Published: {published}\n   {description}"
+            summary = (
+                f"{idx}. [{tickers}] {article.title}\n   Published: {published}\n   {description}"
+            )
             summaries.append(summary)
 
         return "\n\n".join(summaries)
@@ -183,11 +190,7 @@ Respond with ONLY the JSON object, no other text."""
         if not prices:
             return "No price data available."
 
-        lines = []
-        for ticker, price in sorted(prices.items()):
-            lines.append(f"  {ticker}: ${price:.2f}")
-
-        return "\n".join(lines)
+        return "\n".join(f"  {ticker}: ${price:.2f}" for ticker, price in sorted(prices.items()))
 
     @staticmethod
     def format_price_changes(
@@ -197,10 +200,11 @@ Respond with ONLY the JSON object, no other text."""
         if not current_prices or not previous_prices:
             return "No price change data available."
 
+        # Only tickers priced in both snapshots can have a change
         lines = []
-        for ticker in sorted(current_prices.keys()):
-            current = current_prices.get(ticker)
-            previous = previous_prices.get(ticker)
+        for ticker in sorted(current_prices.keys() & previous_prices.keys()):
+            current = current_prices[ticker]
+            previous = previous_prices[ticker]
 
             if current is not None and previous is not None:
                 change = current - previous
@@ -213,15 +217,15 @@ Respond with ONLY the JSON object, no other text."""
     @classmethod
     def build_pre_market_prompt(
         cls,
-        news_articles: list[dict],
+        news_articles: list[NewsArticle],
         current_prices: dict[str, float],
         time_to_open: str = "30 minutes",
-        watchlist: list[str] | None = None,
+        watchlist: Sequence[str] | None = None,
     ) -> str:
         """Build complete pre-market analysis prompt.
 
         Args:
-            news_articles: List of news article dictionaries
+            news_articles: List of NewsArticle objects
             current_prices: Current prices for tickers
             time_to_open: Time until market opens
             watchlist: List of ticker symbols to analyze (optional)
@@ -243,17 +247,17 @@ Respond with ONLY the JSON object, no other text."""
     @classmethod
     def build_realtime_prompt(
         cls,
-        news_articles: list[dict],
+        news_articles: list[NewsArticle],
         current_prices: dict[str, float],
         previous_prices: dict[str, float] | None = None,
         market_status: str = "OPEN",
         time_window: str = "30 minutes",
-        watchlist: list[str] | None = None,
+        watchlist: Sequence[str] | None = None,
     ) -> str:
         """Build complete realtime analysis prompt.
 
         Args:
-            news_articles: List of news article dictionaries
+            news_articles: List of NewsArticle objects
             current_prices: Current prices for tickers
             previous_prices: Previous prices for comparison
             market_status: Market status (OPEN, CLOSED, etc.)
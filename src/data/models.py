@@ -6,7 +6,7 @@ Pydantic models for news articles and stock data.
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_serializer
 
 
 class NewsInsight(BaseModel):
@@ -50,8 +50,10 @@ class NewsArticle(BaseModel):
     )
     processed: bool = Field(default=False, description="Whether article has been processed by LLM")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    @field_serializer("published_utc", "collected_at", when_used="json")
+    def serialize_datetime(self, value: datetime) -> str:
+        """Serialize timestamps with isoformat() (keeps the +00:00 offset form)."""
+        return value.isoformat()
 
     @property
     def sentiment_summary(self) -> dict[str, int]:
@@ -150,8 +152,10 @@ class StockPrice(BaseModel):
     # Additional trade data
     trade_conditions: list[str] | None = Field(default_factory=list, description="Trade conditions")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    @field_serializer("timestamp", when_used="json")
+    def serialize_datetime(self, value: datetime) -> str:
+        """Serialize timestamps with isoformat() (keeps the +00:00 offset form)."""
+        return value.isoformat()
 
 
 class StockQuote(BaseModel):
@@ -167,9 +171,24 @@ class StockQuote(BaseModel):
     previous_close: float = Field(..., alias="pc", description="Previous close price")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Quote timestamp")
 
-    class Config:
-        populate_by_name = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    model_config = ConfigDict(populate_by_name=True)
+
+    @field_serializer("timestamp", when_used="json")
+    def serialize_datetime(self, value: datetime) -> str:
+        """Serialize timestamps with isoformat() (keeps the +00:00 offset form)."""
+        return value.isoformat()
+
+
+class PriceSnapshot(BaseModel):
+    """Quotes for all tickers collected in one poll (one line of a prices NDJSON file)."""
+
+    collected_at: datetime = Field(..., description="Collection timestamp")
+    quotes: dict[str, StockQuote] = Field(default_factory=dict, description="Quotes by ticker")
+
+    @field_serializer("collected_at", when_used="json")
+    def serialize_datetime(self, value: datetime) -> str:
+        """Serialize timestamps with isoformat() (keeps the +00:00 offset form)."""
+        return value.isoformat()
 
 
 class PriceCollectionStats(BaseModel):
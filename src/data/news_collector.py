@@ -4,12 +4,17 @@ News Collector Module
 Collects real-time US stock market news using Massive API.
 """
 
+import json
+import sys
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 from tenacity import (
     before_sleep_log,
     retry,
@@ -27,7 +32,9 @@ except ImportError:
     MASSIVE_AVAILABLE = False
     logger.warning("massive library not installed. Run: pip install massive")
 
-from ..utils.config_loader import ConfigLoader
+from ..utils.config_loader import ConfigLoader, get_config_loader
+from ..utils.file_cache import FileCache
+from ..utils.rate_limiter import RateLimiter
 from .models import NewsArticle, NewsCollectionStats, NewsInsight, NewsPublisher
 
 
@@ -40,6 +47,7 @@ class MassiveNewsCollector:
         trace: bool = False,
         verbose: bool = False,
         config_loader: ConfigLoader | None = None,
+        cache: FileCache | None = None,
     ):
         """
         Initialize Massive news collector.
@@ -48,7 +56,8 @@ class MassiveNewsCollector:
             api_key: Massive API key
             trace: Enable trace mode for debugging
             verbose: Enable verbose logging
-            config_loader: Optional config loader (creates new one if not provided)
+            config_loader: Optional config loader (uses the shared default if not provided)
+            cache: Optional disk cache for per-ticker results (disabled if not provided)
         """
         if not MASSIVE_AVAILABLE:
             raise ImportError("massive library is required. Install it with: pip install massive")
@@ -58,7 +67,7 @@ class MassiveNewsCollector:
 
         # Load settings from config
         if config_loader is None:
-            config_loader = ConfigLoader()
+            config_loader = get_config_loader()
 
         # Rate limiting settings
         self.REQUEST_DELAY_SECONDS = config_loader.get_constant(
@@ -66,6 +75,26 @@ class MassiveNewsCollector:
         )
         self.MAX_RETRIES = config_loader.get_constant("news_collector.max_retries", 3)
 
+        # Concurrent per-ticker fetches; every API call (including retries)
+        # starts at least REQUEST_DELAY_SECONDS after the previous one
+        self.MAX_WORKERS = config_loader.get_constant("news_collector.max_workers", 4)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS, thread_name_prefix="massive-news"
+        )
+        self._rate_limiter = RateLimiter(
+            1.0 / self.REQUEST_DELAY_SECONDS if self.REQUEST_DELAY_SECONDS > 0 else 0
+        )
+
+        # Near-duplicate filter for market news (wire reprints, rewritten stories)
+        self.DEDUP_THRESHOLD = config_loader.get_constant("news_collector.dedup_threshold", 0.7)
+
+        # Optional disk cache keyed by (ticker, query window)
+        self._cache = cache
+        self.CACHE_TTL_SECONDS = config_loader.get_constant("news_collector.cache_ttl_seconds", 300)
+
+        # Keep-alive session for direct REST calls, created on first use
+        self._session: requests.Session | None = None
+
         # Memory management for seen articles
         self.MAX_SEEN_ARTICLES = config_loader.get_constant(
             "news_collector.max_seen_articles", 10000
@@ -81,7 +110,7 @@ class MassiveNewsCollector:
         logger.info(
             f"MassiveNewsCollector initialized "
             f"(delay={self.REQUEST_DELAY_SECONDS}s, retries={self.MAX_RETRIES}, "
-            f"max_seen={self.MAX_SEEN_ARTICLES})"
+            f"workers={self.MAX_WORKERS}, max_seen={self.MAX_SEEN_ARTICLES})"
         )
 
     def _parse_news_response(self, news_data) -> NewsArticle:
@@ -161,10 +190,11 @@ class MassiveNewsCollector:
             )
 
         # Parse published_utc
+        # (fromisoformat accepts the trailing "Z" directly on Python 3.11+)
         published_utc = news_data.get("published_utc")
         if isinstance(published_utc, str):
-            published_utc = datetime.fromisoformat(published_utc.replace("Z", "+00:00"))
-        elif not isinstance(published_utc, datetime):
+            published_utc = datetime.fromisoformat(published_utc)
+        if not isinstance(published_utc, datetime):
             # Fallback to current time if not parseable
             published_utc = datetime.now(UTC)
         elif published_utc.tzinfo is None:
@@ -178,7 +208,8 @@ class MassiveNewsCollector:
             author=news_data.get("author"),
             published_utc=published_utc,
             article_url=news_data["article_url"],
-            tickers=news_data.get("tickers", []),
+            # Intern tickers: the same symbols repeat across thousands of articles
+            tickers=[sys.intern(ticker) for ticker in news_data.get("tickers") or []],
             amp_url=news_data.get("amp_url"),
             image_url=news_data.get("image_url"),
             description=news_data.get("description"),
@@ -209,6 +240,7 @@ class MassiveNewsCollector:
             reraise=True,
         )
         def _fetch():
+            self._rate_limiter.acquire()
             self.api_calls_count += 1
             ticker_kwargs = kwargs.copy()
             ticker_kwargs["ticker"] = ticker
@@ -219,8 +251,15 @@ class MassiveNewsCollector:
 
             return list(self.client.list_ticker_news(**ticker_kwargs))
 
+        cache_key = None
+        if self._cache is not None:
+            cache_key = f"{ticker}:{json.dumps(kwargs, sort_keys=True)}"
+            cached = self._cache.get("news", cache_key, ttl=self.CACHE_TTL_SECONDS)
+            if cached is not None:
+                return cached
+
         try:
-            return _fetch()
+            results = _fetch()
         except Exception as e:
             self.api_errors_count += 1
             logger.warning(
@@ -228,6 +267,69 @@ class MassiveNewsCollector:
             )
             return []
 
+        if cache_key is not None:
+            self._cache.set("news", cache_key, self._to_cache_records(results))
+        return results
+
+    def _to_cache_records(self, news_results: list) -> list[dict[str, Any]]:
+        """
+        Convert raw API results into JSON-serializable dicts for the disk cache.
+
+        Records round-trip through _parse_news_response, so cache hits are
+        parsed exactly like fresh API results.
+
+        Args:
+            news_results: Raw news results (TickerNews objects or dicts)
+
+        Returns:
+            List of JSON-serializable article dicts
+        """
+        records = []
+        for news_data in news_results:
+            try:
+                article = self._parse_news_response(news_data)
+            except Exception:
+                continue
+            records.append(article.model_dump(mode="json", exclude={"collected_at", "processed"}))
+        return records
+
+    def _parse_results(
+        self, news_results: list, articles: list[NewsArticle], parse_errors: int
+    ) -> int:
+        """
+        Parse one batch of raw results into articles, skipping seen IDs.
+
+        Args:
+            news_results: Raw news results (TickerNews objects or dicts)
+            articles: List the parsed articles are appended to
+            parse_errors: Parse errors so far in this fetch (for log throttling)
+
+        Returns:
+            Updated parse error count
+        """
+        for news_data in news_results:
+            # Convert to dict if it's an object
+            if not isinstance(news_data, dict):
+                news_data = news_data.__dict__ if hasattr(news_data, "__dict__") else news_data
+
+            # Skip if we've already seen this article
+            article_id = news_data.get("id")
+            if article_id in self.seen_article_ids:
+                continue
+
+            # Parse and add article
+            try:
+                article = self._parse_news_response(news_data)
+                articles.append(article)
+                self.seen_article_ids.add(article_id)
+
+            except Exception as e:
+                parse_errors += 1
+                if parse_errors <= 3:  # Only log first few errors
+                    logger.error(f"Failed to parse article {article_id}: {e}")
+
+        return parse_errors
+
     def fetch_news(
         self,
         tickers: list[str] | None = None,
@@ -265,26 +367,30 @@ class MassiveNewsCollector:
                 f"published_after={published_after.strftime('%Y-%m-%d') if published_after else 'any'}"
             )
 
-            # Fetch news from API
-            news_results = []
+            # Fetch news from API; each batch is parsed as soon as it arrives so
+            # raw SDK objects never pile up alongside the parsed articles
+            parse_errors = 0
             successful_tickers = []
             failed_tickers = []
 
             if tickers:
-                # Fetch for each ticker with rate limiting
-                for idx, ticker in enumerate(tickers):
-                    # Rate limiting: add delay between requests
-                    if idx > 0:
-                        time.sleep(self.REQUEST_DELAY_SECONDS)
+                # Fan out one fetch per ticker; the shared rate limiter paces them
+                futures = [
+                    self._executor.submit(self._fetch_ticker_news_with_retry, ticker, kwargs)
+                    for ticker in tickers
+                ]
 
+                for ticker, future in zip(tickers, futures, strict=True):
                     try:
-                        ticker_news = self._fetch_ticker_news_with_retry(ticker, kwargs)
-                        news_results.extend(ticker_news)
-                        successful_tickers.append(ticker)
-                        logger.debug(f"✓ {ticker}: {len(ticker_news)} articles")
+                        ticker_news = future.result()
                     except Exception:
                         failed_tickers.append(ticker)
                         logger.debug(f"✗ {ticker}: failed")
+                        continue
+
+                    successful_tickers.append(ticker)
+                    logger.debug(f"✓ {ticker}: {len(ticker_news)} articles")
+                    parse_errors = self._parse_results(ticker_news, articles, parse_errors)
 
                 # Log summary
                 logger.info(
@@ -299,6 +405,7 @@ class MassiveNewsCollector:
                     )
             else:
                 # Fetch all news without ticker filter
+                news_results = []
                 try:
 
                     @retry(
@@ -308,6 +415,7 @@ class MassiveNewsCollector:
                         before_sleep=before_sleep_log(logger, "WARNING"),
                     )
                     def _fetch_all():
+                        self._rate_limiter.acquire()
                         self.api_calls_count += 1
                         fetch_kwargs = kwargs.copy()
                         if "ticker" in fetch_kwargs:
@@ -323,32 +431,7 @@ class MassiveNewsCollector:
                     self.api_errors_count += 1
                     logger.error(f"Failed to fetch all news: {e}")
 
-            # Parse results
-            parsed_count = 0
-            parse_errors = 0
-
-            for news_data in news_results:
-                # Convert to dict if it's an object
-                if not isinstance(news_data, dict):
-                    news_data = news_data.__dict__ if hasattr(news_data, "__dict__") else news_data
-
-                # Skip if we've already seen this article
-                article_id = news_data.get("id")
-                if article_id in self.seen_article_ids:
-                    continue
-
-                # Parse and add article
-                try:
-                    article = self._parse_news_response(news_data)
-                    articles.append(article)
-                    self.seen_article_ids.add(article_id)
-                    parsed_count += 1
-
-                except Exception as e:
-                    parse_errors += 1
-                    if parse_errors <= 3:  # Only log first few errors
-                        logger.error(f"Failed to parse article {article_id}: {e}")
-                    continue
+                parse_errors = self._parse_results(news_results, articles, parse_errors)
 
             # Clean up seen_article_ids if it gets too large
             if len(self.seen_article_ids) > self.MAX_SEEN_ARTICLES:
@@ -377,6 +460,31 @@ class MassiveNewsCollector:
 
         return articles
 
+    def _get_session(self) -> requests.Session:
+        """
+        Get the keep-alive session for direct REST calls.
+
+        The pool is sized to the worker count so concurrent fallback calls
+        reuse connections instead of opening a new TLS handshake each.
+
+        Returns:
+            Shared requests session
+        """
+        if self._session is None:
+            session = requests.Session()
+            session.headers["Authorization"] = f"Bearer {self.api_key}"
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_WORKERS)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Shut down the fetch workers and close the keep-alive session."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def _fetch_news_direct(self, **kwargs) -> list[dict[str, Any]]:
         """
         Fetch news using direct REST call (fallback method).
@@ -387,19 +495,15 @@ class MassiveNewsCollector:
         Returns:
             List of raw news data dictionaries
         """
-        import requests
-
         url = "https://api.massive.com/v2/reference/news"
 
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-
         params = {}
         for key, value in kwargs.items():
             if value is not None:
                 params[key] = value
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self._get_session().get(url, params=params, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -442,17 +546,59 @@ class MassiveNewsCollector:
             limit: Maximum number of articles to fetch
 
         Returns:
-            List of NewsArticle objects
+            List of NewsArticle objects, newest first
         """
         published_after = datetime.now(UTC) - timedelta(hours=hours_back)
 
         logger.info(f"Fetching market news (no ticker filter, last {hours_back} hours)")
 
-        return self.fetch_news(
+        articles = self.fetch_news(
             tickers=None,  # No ticker filter - fetch all market news
             limit=limit,
             published_after=published_after,
         )
+        return self._drop_near_duplicates(articles)
+
+    @staticmethod
+    def _shingles(article: NewsArticle) -> frozenset[int]:
+        """Character 5-gram shingles of an article's title and description."""
+        text = " ".join(f"{article.title} {(article.description or '')[:200]}".lower().split())
+        return frozenset(hash(text[i : i + 5]) for i in range(max(len(text) - 4, 1)))
+
+    def _drop_near_duplicates(self, articles: list[NewsArticle]) -> list[NewsArticle]:
+        """
+        Drop articles that are near-duplicates of an earlier one in the list.
+
+        Two articles are duplicates when the Jaccard similarity of their
+        shingle sets reaches DEDUP_THRESHOLD. The first occurrence is kept,
+        so a newest-first list keeps the freshest copy of each story.
+
+        Args:
+            articles: Articles to filter
+
+        Returns:
+            Filtered articles, order preserved
+        """
+        if self.DEDUP_THRESHOLD <= 0 or len(articles) < 2:
+            return articles
+
+        kept: list[NewsArticle] = []
+        kept_shingles: list[frozenset[int]] = []
+
+        for article in articles:
+            shingles = self._shingles(article)
+            if any(
+                len(shingles & other) >= self.DEDUP_THRESHOLD * len(shingles | other)
+                for other in kept_shingles
+            ):
+                continue
+            kept.append(article)
+            kept_shingles.append(shingles)
+
+        if len(kept) < len(articles):
+            logger.info(f"Dropped {len(articles) - len(kept)} near-duplicate articles")
+
+        return kept
 
     def collect_realtime_news(
         self,
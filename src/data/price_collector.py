@@ -8,9 +8,11 @@ import json
 import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
 try:
     import finnhub
@@ -23,18 +25,28 @@ except ImportError:
         "finnhub-python library not installed. Run: pip install finnhub-python websocket-client"
     )
 
+from ..utils.config_loader import ConfigLoader, get_config_loader
+from ..utils.file_cache import FileCache
+from ..utils.rate_limiter import RateLimiter
 from .models import PriceCollectionStats, StockPrice, StockQuote
 
 
 class FinnhubPriceCollector:
     """Collects real-time stock prices from Finnhub API."""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        config_loader: ConfigLoader | None = None,
+        cache: FileCache | None = None,
+    ):
         """
         Initialize Finnhub price collector.
 
         Args:
             api_key: Finnhub API key
+            config_loader: Optional config loader (uses the shared default if not provided)
+            cache: Optional disk cache for REST quotes (disabled if not provided)
         """
         if not FINNHUB_AVAILABLE:
             raise ImportError(
@@ -44,6 +56,30 @@ class FinnhubPriceCollector:
         self.api_key = api_key
         self.client = finnhub.Client(api_key=api_key)
 
+        # Load settings from config
+        if config_loader is None:
+            config_loader = get_config_loader()
+
+        # Concurrent REST fan-out (quote requests are I/O bound)
+        self.MAX_WORKERS = config_loader.get_constant("price_collector.max_workers", 8)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS, thread_name_prefix="finnhub-quote"
+        )
+        self._rate_limiter = RateLimiter(
+            config_loader.get_constant("price_collector.max_requests_per_second", 25)
+        )
+
+        # Optional disk cache so back-to-back runs reuse recent quotes
+        self._cache = cache
+        self.CACHE_TTL_SECONDS = config_loader.get_constant("price_collector.cache_ttl_seconds", 60)
+
+        # Size the client's keep-alive pool to the worker count so concurrent
+        # quotes reuse connections instead of re-handshaking TLS
+        session = getattr(self.client, "_session", None)
+        if session is not None:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_WORKERS)
+            session.mount("https://", adapter)
+
         # WebSocket state
         self.ws: websocket.WebSocketApp | None = None
         self.ws_thread: threading.Thread | None = None
@@ -56,7 +92,7 @@ class FinnhubPriceCollector:
         # Statistics
         self.stats = PriceCollectionStats()
 
-        logger.info("FinnhubPriceCollector initialized")
+        logger.info(f"FinnhubPriceCollector initialized (workers={self.MAX_WORKERS})")
 
     def get_quote(self, ticker: str) -> StockQuote | None:
         """
@@ -69,7 +105,15 @@ class FinnhubPriceCollector:
             StockQuote object or None if failed
         """
         try:
-            quote_data = self.client.quote(ticker)
+            quote_data = None
+            if self._cache is not None:
+                quote_data = self._cache.get("quotes", ticker, ttl=self.CACHE_TTL_SECONDS)
+
+            if quote_data is None:
+                self._rate_limiter.acquire()
+                quote_data = self.client.quote(ticker)
+                if self._cache is not None and quote_data and quote_data.get("c"):
+                    self._cache.set("quotes", ticker, quote_data)
 
             # Check if valid data
             if not quote_data or quote_data.get("c") == 0:
@@ -97,6 +141,9 @@ class FinnhubPriceCollector:
         """
         Get current quotes for multiple tickers.
 
+        Requests are issued concurrently on a shared thread pool, so a poll
+        takes roughly one round-trip instead of one round-trip per ticker.
+
         Args:
             tickers: List of ticker symbols
 
@@ -105,14 +152,23 @@ class FinnhubPriceCollector:
         """
         quotes = {}
 
-        for ticker in tickers:
-            quote = self.get_quote(ticker)
+        # One request per distinct symbol, even if the caller repeats tickers
+        tickers = list(dict.fromkeys(tickers))
+
+        for ticker, quote in zip(tickers, self._executor.map(self.get_quote, tickers), strict=True):
             if quote:
                 quotes[ticker] = quote
                 logger.debug(f"{ticker}: ${quote.current_price:.2f} ({quote.percent_change:+.2f}%)")
 
         return quotes
 
+    def close(self) -> None:
+        """Shut down the quote workers and close the client's keep-alive session."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        session = getattr(self.client, "_session", None)
+        if session is not None:
+            session.close()
+
     def start_websocket(
         self, tickers: list[str], callback: Callable[[StockPrice], None] | None = None
     ):
@@ -310,6 +366,8 @@ class FinnhubPriceCollector:
         else:
             logger.info("Duration: Indefinite (press Ctrl+C to stop)")
 
+        next_poll = time.monotonic()
+
         try:
             while True:
                 # Check if we should stop
@@ -320,6 +378,7 @@ class FinnhubPriceCollector:
                         break
 
                 # Fetch quotes
+                next_poll += interval_seconds
                 quotes = self.get_quotes(tickers)
 
                 # Update statistics
@@ -333,8 +392,12 @@ class FinnhubPriceCollector:
                     except Exception as e:
                         logger.error(f"Callback error: {e}")
 
-                # Wait before next poll
-                time.sleep(interval_seconds)
+                # Wait until the next scheduled poll (fetch time is not added to the interval)
+                delay = next_poll - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_poll = time.monotonic()
 
         except KeyboardInterrupt:
             logger.info("Collection stopped by user")
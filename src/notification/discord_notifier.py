@@ -4,24 +4,36 @@ Discord Notification Module
 Sends trading signals and reports to Discord via webhook.
 """
 
+import functools
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from ..data.models import StockQuote
 
 
 class DiscordNotifier:
     """Discord webhook notification handler."""
 
-    def __init__(self, webhook_url: str):
+    # Discord rejects message content longer than this (HTTP 400)
+    MAX_CONTENT_LENGTH = 2000
+
+    def __init__(self, webhook_url: str, session: requests.Session | None = None):
         """
         Initialize Discord notifier.
 
         Args:
             webhook_url: Discord webhook URL
+            session: Optional HTTP session to reuse (creates new one if not provided)
         """
         self.webhook_url = webhook_url
+        # Persistent session keeps the TLS connection to Discord alive between messages
+        self.session = session or requests.Session()
 
     def _send_message(self, content: str = "", embeds: list[dict[str, Any]] = None) -> bool:
         """
@@ -37,13 +49,19 @@ class DiscordNotifier:
         payload = {}
 
         if content:
+            if len(content) > self.MAX_CONTENT_LENGTH:
+                logger.warning(
+                    f"Discord 메시지 길이 초과 ({len(content)}자) - "
+                    f"{self.MAX_CONTENT_LENGTH}자로 잘라서 전송"
+                )
+                content = content[: self.MAX_CONTENT_LENGTH - 1] + "…"
             payload["content"] = content
 
         if embeds:
             payload["embeds"] = embeds
 
         try:
-            response = requests.post(self.webhook_url, json=payload, timeout=10)
+            response = self.session.post(self.webhook_url, json=payload, timeout=10)
             response.raise_for_status()
             logger.info("✅ Discord 알림 전송 완료")
             return True
@@ -142,6 +160,7 @@ class DiscordNotifier:
         price_data: dict[str, Any] | None = None,
         news_title: str | None = None,
         news_url: str | None = None,
+        quote: "StockQuote | None" = None,
     ) -> bool:
         """
         실시간 트레이딩 시그널 전송
@@ -154,10 +173,14 @@ class DiscordNotifier:
             price_data: 가격 정보 (current, change_percent, rsi, macd, volume)
             news_title: 뉴스 헤드라인
             news_url: 뉴스 링크
+            quote: 시세 (price_data가 없을 때 현재가/등락률 표시에 사용)
 
         Returns:
             성공 여부
         """
+        if price_data is None and quote is not None:
+            price_data = {"current": quote.current_price, "change_percent": quote.percent_change}
+
         # 액션별 이모지
         action_emoji = {"buy": "📈", "sell": "📉", "hold": "⏸️"}
         emoji = action_emoji.get(action.lower(), "🚨")
@@ -493,6 +516,52 @@ class DiscordNotifier:
         return self._send_message(content=content)
 
 
+@functools.cache
+def _shared_session() -> requests.Session:
+    """
+    Process-wide HTTP session for Discord webhooks (keep-alive, short retries).
+
+    Rate-limited (429) posts are retried after Discord's Retry-After delay,
+    which is safe because the message was not accepted. Read errors are not
+    retried, so a slow response never turns into a duplicate message.
+
+    Returns:
+        Shared requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            read=0,
+            backoff_factor=0.1,
+            status_forcelist=(429,),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=8)
+def get_notifier(webhook_url: str) -> DiscordNotifier:
+    """
+    Get the shared notifier for a webhook URL.
+
+    All notifiers returned here use one pooled session, so every webhook
+    reuses the same keep-alive connection to discord.com.
+
+    Args:
+        webhook_url: Discord webhook URL
+
+    Returns:
+        DiscordNotifier instance (memoized per URL)
+    """
+    return DiscordNotifier(webhook_url, session=_shared_session())
+
+
 # 테스트 함수
 def test_discord_webhook(webhook_url: str):
     """
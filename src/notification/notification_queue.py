@@ -0,0 +1,107 @@
+"""
+Notification Queue Module
+
+Sends Discord notifications from a background thread so producers
+(e.g. WebSocket tick callbacks) never block on webhook latency.
+"""
+
+import queue
+import threading
+import time
+from typing import Any
+
+from loguru import logger
+
+from .discord_notifier import DiscordNotifier
+
+# Sentinel that tells the worker thread to stop
+_STOP = object()
+
+
+class NotificationQueue:
+    """Bounded fire-and-forget wrapper around DiscordNotifier."""
+
+    def __init__(
+        self,
+        notifier: DiscordNotifier,
+        maxsize: int = 1024,
+        coalesce_seconds: float = 5.0,
+    ):
+        """
+        Initialize notification queue and start its worker thread.
+
+        Args:
+            notifier: Discord notifier used by the worker thread
+            maxsize: Maximum pending notifications (oldest is dropped when full)
+            coalesce_seconds: Drop repeat alerts for the same ticker and action within this
+                window (0 disables coalescing)
+        """
+        self.notifier = notifier
+        self.coalesce_seconds = coalesce_seconds
+
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._last_queued: dict[tuple[str, Any], float] = {}
+        self.dropped_count = 0
+
+        self._thread = threading.Thread(target=self._drain, name="discord-notify", daemon=True)
+        self._thread.start()
+
+    def send_realtime_signal(self, ticker: str, **kwargs: Any) -> bool:
+        """
+        Queue a realtime signal (same arguments as DiscordNotifier.send_realtime_signal).
+
+        Args:
+            ticker: Ticker symbol
+            **kwargs: Remaining send_realtime_signal arguments
+
+        Returns:
+            True if queued, False if coalesced with a recent alert for the same
+            ticker and action (a reversal, e.g. UP then DOWN, is always queued)
+        """
+        now = time.monotonic()
+        key = (ticker, kwargs.get("action"))
+        last = self._last_queued.get(key)
+        if last is not None and now - last < self.coalesce_seconds:
+            return False
+        self._last_queued[key] = now
+
+        self._put({"ticker": ticker, **kwargs})
+        return True
+
+    def _put(self, item: Any) -> None:
+        """Enqueue without blocking, dropping the oldest pending item when full."""
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped_count += 1
+                except queue.Empty:
+                    pass
+
+    def _drain(self) -> None:
+        """Worker loop: send queued notifications until stopped."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            try:
+                self.notifier.send_realtime_signal(**item)
+            except Exception as e:
+                logger.error(f"Failed to send Discord notification: {e}")
+
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Flush pending notifications and stop the worker thread.
+
+        Args:
+            timeout: Seconds to wait for pending notifications to be sent
+        """
+        self._put(_STOP)
+        self._thread.join(timeout=timeout)
+
+        if self.dropped_count:
+            logger.warning(f"Dropped {self.dropped_count} notifications (queue full)")
@@ -6,6 +6,7 @@ Trading signal generation and position management pipeline.
 
 from .position_tracker import Position, PositionTracker
 from .scheduler import TradingScheduler
+from .shared_cache import SharedMarketCache
 from .signal_manager import SignalManager, TradingAction
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "PositionTracker",
     "Position",
     "TradingScheduler",
+    "SharedMarketCache",
 ]
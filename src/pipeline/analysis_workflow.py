@@ -5,11 +5,19 @@ Abstracts common workflow between pre-market and realtime analysis,
 eliminating ~70% code duplication.
 """
 
+import hashlib
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from itertools import takewhile
+from operator import attrgetter
 
 from loguru import logger
 
+# StockQuote -> 현재가 (dict(zip(...))로 C 레벨에서 가격 dict 구성)
+_current_price = attrgetter("current_price")
+
 
 class AnalysisWorkflow(ABC):
     """
@@ -32,7 +40,7 @@ class AnalysisWorkflow(ABC):
         signal_manager,
         position_tracker,
         discord_notifier,
-        tickers: list[str],
+        tickers: Sequence[str],
         pipeline_config: dict,
     ):
         self.news_collector = news_collector
@@ -43,6 +51,8 @@ class AnalysisWorkflow(ABC):
         self.discord = discord_notifier
         self.tickers = tickers
         self.config = pipeline_config
+        self._current_prices: dict[str, float] | None = None
+        self._news_hash: bytes | None = None
 
     def run(self) -> None:
         """Main workflow execution (Template Method)"""
@@ -53,28 +63,53 @@ class AnalysisWorkflow(ABC):
         with ErrorContext(
             self.get_operation_name(), discord=self.discord, retry_info=self.get_retry_info()
         ):
-            # 1. Collect news
-            news_articles = self.collect_news()
-            if not news_articles:
-                logger.warning("뉴스 없음 - 분석 중단")
-                self._handle_no_news()
-                return
-
-            logger.info(f"뉴스 {len(news_articles)}개 수집 완료")
-
-            # 2. Fetch prices
-            current_prices = self._fetch_prices()
-            logger.info(f"{len(current_prices)}개 종목 가격 조회 완료")
-
-            # 3. LLM analysis
-            analysis_result = self._analyze_news(news_articles, current_prices)
-            logger.success(
-                f"분석 완료. 시그널: {len(analysis_result.ticker_analyses)}개, "
-                f"비용: ${analysis_result.cost_usd:.4f}"
-            )
+            # 1-2. 가격 조회를 백그라운드로 시작하고 뉴스 수집과 병렬 진행
+            executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="workflow-io")
+            try:
+                prices_future = executor.submit(self._fetch_prices)
+
+                news_articles = self.collect_news()
+                if not news_articles:
+                    prices_future.cancel()
+                    logger.warning("뉴스 없음 - 분석 중단")
+                    self._handle_no_news()
+                    return
+
+                logger.info(f"뉴스 {len(news_articles)}개 수집 완료")
+
+                # 직전 실행과 같은 기사 묶음이면 LLM 분석 결과도 같으므로 생략
+                news_hash = self._hash_news(news_articles)
+                if news_hash == self.get_previous_news_hash():
+                    prices_future.cancel()
+                    logger.info("직전 분석 이후 새 뉴스 없음 - 분석 생략")
+                    return
+
+                # 이전 시그널 로드(디스크 I/O)는 LLM 분석 대기 시간에 겹쳐서 진행
+                previous_signals_future = executor.submit(self.get_previous_signals)
+
+                # 시세 조회가 통째로 실패해도 뉴스 분석은 가격 없이 계속 진행
+                try:
+                    current_prices = prices_future.result()
+                except Exception as e:
+                    logger.warning(f"가격 조회 실패 - 가격 없이 분석 진행: {e}")
+                    current_prices = {}
+                self._current_prices = current_prices
+                logger.info(f"{len(current_prices)}개 종목 가격 조회 완료")
+
+                # 3. LLM analysis
+                analysis_result = self._analyze_news(news_articles, current_prices)
+                logger.success(
+                    f"분석 완료. 시그널: {len(analysis_result.ticker_analyses)}개, "
+                    f"비용: ${analysis_result.cost_usd:.4f}"
+                )
+
+                previous_signals = previous_signals_future.result()
+            finally:
+                # 뉴스가 없으면 가격 조회 완료를 기다리지 않음
+                executor.shutdown(wait=False, cancel_futures=True)
 
             # 4. Generate signals
-            signals = self._generate_signals(analysis_result, current_prices)
+            signals = self._generate_signals(analysis_result, current_prices, previous_signals)
             summary = self.signal_manager.get_summary(signals)
             logger.info(
                 f"시그널 생성 완료: "
@@ -96,6 +131,7 @@ class AnalysisWorkflow(ABC):
                 news_articles=news_articles,
             )
 
+            self._news_hash = news_hash
             logger.success(f"✓ {self.get_operation_name()} 완료")
 
     # Abstract methods (서브클래스가 구현)
@@ -146,46 +182,50 @@ class AnalysisWorkflow(ABC):
             context="뉴스 없음",
         )
 
+    def get_previous_news_hash(self) -> bytes | None:
+        """직전 실행의 뉴스 해시 (None이면 항상 분석)"""
+        return None
+
     # Concrete methods (공통 로직)
 
+    @staticmethod
+    def _hash_news(news_articles: list) -> bytes:
+        """기사 ID 집합 해시 (순서 무관)"""
+        ids = sorted(article.id.encode() for article in news_articles)
+        return hashlib.blake2b(b",".join(ids), digest_size=16).digest()
+
+    def get_news_hash(self) -> bytes | None:
+        """분석을 완료한 뉴스 묶음의 해시 반환 (완료하지 못했으면 None)"""
+        return self._news_hash
+
     def _fetch_prices(self) -> dict[str, float]:
         """가격 조회"""
         logger.info("현재 가격 조회 중...")
         quotes = self.price_collector.get_quotes(self.tickers)
-        return {ticker: quote.current_price for ticker, quote in quotes.items()}
+        return dict(zip(quotes.keys(), map(_current_price, quotes.values()), strict=True))
 
     def _analyze_news(self, news_articles: list, current_prices: dict):
         """LLM 뉴스 분석"""
         logger.info("GPT-4o mini로 뉴스 분석 중...")
 
-        # Convert NewsArticle objects to dicts
-        news_dicts = [
-            {
-                "id": article.id,
-                "title": article.title,
-                "description": article.description,
-                "published_utc": article.published_utc.isoformat(),
-                "tickers": article.tickers,
-            }
-            for article in news_articles
-        ]
-
         return self.llm_agent.analyze_news(
-            news_articles=news_dicts,
+            news_articles=news_articles,
             current_prices=current_prices,
             mode=self.get_analysis_mode(),
             watchlist=self.tickers,
             **self.get_analysis_kwargs(),
         )
 
-    def _generate_signals(self, analysis_result, current_prices: dict) -> dict:
+    def _generate_signals(
+        self, analysis_result, current_prices: dict, previous_signals: dict | None
+    ) -> dict:
         """시그널 생성"""
         logger.info("트레이딩 시그널 생성 중...")
 
         signals = self.signal_manager.generate_signals(
             analysis_result=analysis_result,
             mode=self.get_analysis_mode(),
-            previous_signals=self.get_previous_signals(),
+            previous_signals=previous_signals,
             current_prices=current_prices,
         )
 
@@ -248,10 +288,19 @@ class PreMarketAnalysisWorkflow(AnalysisWorkflow):
 class RealtimeAnalysisWorkflow(AnalysisWorkflow):
     """실시간 분석 워크플로우"""
 
-    def __init__(self, *args, previous_prices: dict | None = None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        previous_prices: Mapping[str, float] | None = None,
+        previous_news_hash: bytes | None = None,
+        signal_notifier=None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.previous_prices = previous_prices
-        self._current_prices: dict[str, float] | None = None
+        self.previous_news_hash = previous_news_hash
+        # 종목별 알림 전송 대상 (NotificationQueue를 주면 백그라운드로 전송)
+        self.signal_notifier = signal_notifier or self.discord
 
     def get_operation_name(self) -> str:
         return "실시간 분석"
@@ -274,9 +323,12 @@ class RealtimeAnalysisWorkflow(AnalysisWorkflow):
         )
 
         # 최근 N분 이내 뉴스만 필터링
+        # (발행 시각 내림차순 결과이므로 기준 시각 이전 기사를 만나면 스캔 중단)
         now = datetime.now(UTC)
         cutoff_time = now - timedelta(minutes=config["news_cutoff_minutes"])
-        recent_news = [article for article in news_articles if article.published_utc >= cutoff_time]
+        recent_news = list(
+            takewhile(lambda article: article.published_utc >= cutoff_time, news_articles)
+        )
 
         logger.info(f"최근 {config['news_cutoff_minutes']}분 이내 기사 {len(recent_news)}개 발견")
         return recent_news
@@ -285,11 +337,6 @@ class RealtimeAnalysisWorkflow(AnalysisWorkflow):
         """뉴스 없을 때 - 조용히 넘어감"""
         logger.info("최근 뉴스 없음. 분석 생략.")
 
-    def _fetch_prices(self) -> dict[str, float]:
-        """가격 조회 및 캐싱"""
-        self._current_prices = super()._fetch_prices()
-        return self._current_prices
-
     def get_analysis_kwargs(self) -> dict:
         return {
             "previous_prices": self.previous_prices,
@@ -297,11 +344,14 @@ class RealtimeAnalysisWorkflow(AnalysisWorkflow):
             "time_window": "30 minutes",
         }
 
+    def get_previous_news_hash(self) -> bytes | None:
+        return self.previous_news_hash
+
     def get_previous_signals(self) -> dict | None:
         """보수적 필터링을 위한 이전 시그널"""
         return self.signal_manager.get_latest_signals()
 
-    def get_current_prices(self) -> dict[str, float] | None:
+    def get_current_prices(self) -> Mapping[str, float] | None:
         """현재 가격 반환 (previous_prices 업데이트용)"""
         return self._current_prices
 
@@ -313,29 +363,32 @@ class RealtimeAnalysisWorkflow(AnalysisWorkflow):
 
         logger.info("변경사항에 대한 Discord 알림 전송 중...")
 
-        quotes = self.price_collector.get_quotes(list(actionable_changes.keys()))
+        # 시세를 못 받아도 알림은 가격 정보 없이 전송
+        try:
+            quotes = self.price_collector.get_quotes(list(actionable_changes.keys()))
+        except Exception as e:
+            logger.warning(f"알림용 가격 조회 실패: {e}")
+            quotes = {}
+
+        # 종목별 최신 기사 인덱스 (뉴스는 최신순이므로 처음 본 기사가 가장 최신)
+        latest_news: dict = {}
+        for article in news_articles:
+            for article_ticker in article.tickers:
+                latest_news.setdefault(article_ticker, article)
 
         for ticker, change in actionable_changes.items():
-            quote = quotes.get(ticker)
-            price_data = None
-            if quote:
-                price_data = {
-                    "current": quote.current_price,
-                    "change_percent": quote.percent_change,
-                }
-
-            ticker_news = [n for n in news_articles if ticker in n.tickers]
-            news_title = ticker_news[0].title if ticker_news else None
-            news_url = ticker_news[0].article_url if ticker_news else None
-
-            self.discord.send_realtime_signal(
+            article = latest_news.get(ticker)
+            news_title = article.title if article else None
+            news_url = article.article_url if article else None
+
+            self.signal_notifier.send_realtime_signal(
                 ticker=ticker,
                 action=change["new_action"],
                 confidence=change["new_confidence"],
                 reasoning=change["reasoning"][:200],
-                price_data=price_data,
                 news_title=news_title,
                 news_url=news_url,
+                quote=quotes.get(ticker),
             )
 
-            logger.info(f"{ticker} 알림 전송 완료")
+            logger.info(f"{ticker} 알림 전송 요청 완료")
@@ -5,7 +5,8 @@
 한국 표준시(KST) 기준으로 미국 시장 트레이딩 진행
 """
 
-import time
+import signal
+import threading
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from datetime import time as dt_time
@@ -73,6 +74,9 @@ class TradingScheduler:
         self.market_holiday_notified_today = False
         self.market_open_notified_today = False
 
+        # stop()이 대기 중인 루프를 즉시 깨우도록 sleep 대신 Event 사용
+        self._stop_event = threading.Event()
+
         logger.info("트레이딩 스케줄러 초기화 완료 (한국 시간)")
 
     def _get_default_config(self) -> dict[str, Any]:
@@ -342,6 +346,11 @@ class TradingScheduler:
             run_forever: True면 무한 실행, False면 한 번만 실행
         """
         self.is_running = True
+        self._stop_event.clear()
+
+        # SIGTERM(systemd/docker 종료)도 Ctrl+C처럼 루프를 정상 종료
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._handle_sigterm)
 
         logger.info("=" * 70)
         logger.info("🐦‍⬛ 까악 트레이딩 파이프라인 시작 (한국 시간)")
@@ -466,8 +475,8 @@ class TradingScheduler:
                 if self.should_run_post_market_analysis():
                     self.run_post_market_analysis()
 
-                # 다음 체크까지 대기 (설정된 간격)
-                time.sleep(self.CHECK_INTERVAL_SECONDS)
+                # 다음 체크까지 대기 (실시간 분석 예정 시각은 넘기지 않음)
+                self._stop_event.wait(self._seconds_until_next_check())
 
                 if not run_forever:
                     break
@@ -479,8 +488,38 @@ class TradingScheduler:
     def stop(self) -> None:
         """스케줄러 중지"""
         self.is_running = False
+        self._stop_event.set()
         logger.info("스케줄러 중지됨")
 
+    def _handle_sigterm(self, signum, frame) -> None:
+        """SIGTERM 수신 시 스케줄러 중지"""
+        logger.info("🛑 SIGTERM 수신 - 스케줄러 중지")
+        self.stop()
+
+    def _seconds_until_next_check(self) -> float:
+        """
+        다음 체크까지 대기 시간 계산
+
+        장중에는 다음 실시간 분석 예정 시각에 맞춰 깨어나므로 체크 간격만큼
+        실행이 밀리지 않음
+
+        Returns:
+            대기 시간 (초)
+        """
+        wait_seconds = self.CHECK_INTERVAL_SECONDS
+
+        if self.last_realtime_run is not None:
+            now_et = self.get_current_time_et()
+            if self.is_market_open(now_et):
+                next_run = self.last_realtime_run + timedelta(
+                    minutes=self.REALTIME_INTERVAL_MINUTES
+                )
+                # 예정 시각이 지났으면(직전 실행 실패 등) 기본 간격 유지
+                if next_run > now_et:
+                    wait_seconds = min(wait_seconds, (next_run - now_et).total_seconds())
+
+        return wait_seconds
+
     def get_next_action_info(self) -> tuple[str, str, int]:
         """
         다음 예정 동작과 남은 시간 계산
@@ -0,0 +1,88 @@
+"""
+Shared Market Cache
+
+Process-wide in-memory quote cache shared by every analysis workflow.
+"""
+
+import threading
+import time
+
+from loguru import logger
+
+from ..data.models import StockQuote
+
+
+class SharedMarketCache:
+    """
+    In-memory quote cache in front of a price collector.
+
+    Exposes the same ``get_quotes`` interface as FinnhubPriceCollector, so it
+    can be passed to workflows in its place. Only tickers whose cached quote
+    is missing or expired are fetched, in one batched collector call; expired
+    entries are simply overwritten, so the cache stays bounded by the watchlist.
+    """
+
+    def __init__(self, price_collector, ttl_seconds: float = 60.0):
+        """
+        Initialize shared market cache.
+
+        Args:
+            price_collector: Collector providing get_quotes(tickers)
+            ttl_seconds: How long a fetched quote stays fresh
+        """
+        self.price_collector = price_collector
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[StockQuote, float]] = {}
+        self._lock = threading.Lock()
+
+        logger.info(f"SharedMarketCache initialized (ttl={ttl_seconds}s)")
+
+    def get_quotes(self, tickers: list[str]) -> dict[str, StockQuote]:
+        """
+        Get quotes, fetching only the expired or missing subset.
+
+        Args:
+            tickers: List of ticker symbols
+
+        Returns:
+            Dictionary mapping ticker to StockQuote
+        """
+        now = time.monotonic()
+        quotes: dict[str, StockQuote] = {}
+        stale: list[str] = []
+
+        with self._lock:
+            for ticker in tickers:
+                entry = self._entries.get(ticker)
+                if entry is not None and entry[1] > now:
+                    quotes[ticker] = entry[0]
+                else:
+                    stale.append(ticker)
+
+        if stale:
+            fetched = self.price_collector.get_quotes(stale)
+            expires_at = time.monotonic() + self.ttl_seconds
+            with self._lock:
+                for ticker, quote in fetched.items():
+                    self._entries[ticker] = (quote, expires_at)
+            quotes.update(fetched)
+
+        logger.debug(f"Quote cache: {len(tickers) - len(stale)} hits, {len(stale)} fetched")
+        return quotes
+
+    def get_quote(self, ticker: str) -> StockQuote | None:
+        """
+        Get a single quote through the cache.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            StockQuote or None if unavailable
+        """
+        return self.get_quotes([ticker]).get(ticker)
+
+    def clear(self) -> None:
+        """Drop all cached quotes."""
+        with self._lock:
+            self._entries.clear()
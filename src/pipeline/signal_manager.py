@@ -12,7 +12,7 @@ from pathlib import Path
 from loguru import logger
 
 from src.analysis.models import AnalysisResult, TradingSignal
-from src.utils.config_loader import ConfigLoader
+from src.utils.config_loader import ConfigLoader, get_config_loader
 
 
 class TradingAction(StrEnum):
@@ -43,17 +43,19 @@ class SignalManager:
 
         Args:
             signals_dir: Directory to save signal history
-            config_loader: Optional config loader (creates new one if not provided)
+            config_loader: Optional config loader (uses the shared default if not provided)
         """
         self.signals_dir = Path(signals_dir)
         self.signals_dir.mkdir(parents=True, exist_ok=True)
 
         # Current signals
         self.current_signals: dict[str, dict] = {}
+        # Last saved signals, kept so get_latest_signals() need not re-read disk
+        self._latest_signals: dict[str, dict] | None = None
 
         # Load thresholds from config
         if config_loader is None:
-            config_loader = ConfigLoader()
+            config_loader = get_config_loader()
 
         rules = config_loader.load_trading_rules()
         thresholds = rules.get("thresholds", {})
@@ -237,6 +239,7 @@ class SignalManager:
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
+        self._latest_signals = signals
         logger.info(f"Saved {len(signals)} signals to {filepath}")
 
         return filepath
@@ -271,9 +274,15 @@ class SignalManager:
         """
         Get the latest saved signals.
 
+        Signals saved by this manager are returned from memory; the signals
+        directory is only scanned on the first call after startup.
+
         Returns:
             Latest signals dictionary or None if no signals found
         """
+        if self._latest_signals is not None:
+            return self._latest_signals
+
         signal_files = sorted(self.signals_dir.glob("signals_*.json"), reverse=True)
 
         if not signal_files:
@@ -281,7 +290,8 @@ class SignalManager:
             return None
 
         latest_file = signal_files[0]
-        return self.load_signals(latest_file.name)
+        self._latest_signals = self.load_signals(latest_file.name)
+        return self._latest_signals
 
     def get_changed_signals(
         self,
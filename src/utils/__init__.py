@@ -4,6 +4,8 @@ Utilities Module
 Contains configuration loaders and helper utilities.
 """
 
-from .config_loader import ConfigLoader
+from .config_loader import ConfigLoader, get_config_loader
+from .file_cache import FileCache
+from .rate_limiter import RateLimiter
 
-__all__ = ["ConfigLoader"]
+__all__ = ["ConfigLoader", "FileCache", "RateLimiter", "get_config_loader"]
@@ -4,6 +4,7 @@ Configuration Loader
 Loads configuration from YAML files.
 """
 
+import functools
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,24 @@ from loguru import logger
 from ..data.models import StockConfig
 
 
+def _load_yaml(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    Every ConfigLoader lookup (get_constant in particular) goes through here,
+    so the result is shared and must be treated as read-only. Keying on the
+    modification time means edits are picked up without a restart.
+    """
+    return _parse_yaml(path, path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path: Path, mtime_ns: int) -> Any:
+    """Parse a YAML file (cached per path and modification time)."""
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
 class ConfigLoader:
     """Loads configuration from YAML files."""
 
@@ -47,8 +66,7 @@ class ConfigLoader:
         if not stocks_file.exists():
             raise FileNotFoundError(f"stocks.yaml not found: {stocks_file}")
 
-        with open(stocks_file) as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(stocks_file)
 
         stocks = []
         for stock_data in data.get("stocks", []):
@@ -69,8 +87,7 @@ class ConfigLoader:
         if not rules_file.exists():
             raise FileNotFoundError(f"trading_rules.yaml not found: {rules_file}")
 
-        with open(rules_file) as f:
-            rules = yaml.safe_load(f)
+        rules = _load_yaml(rules_file)
 
         logger.info("Loaded trading rules from config")
         return rules
@@ -194,14 +211,31 @@ class ConfigLoader:
         return [s for s in stocks if s.sector.lower() == sector.lower()]
 
 
+@functools.cache
+def get_config_loader() -> ConfigLoader:
+    """
+    Get the shared ConfigLoader for the default config directory.
+
+    Components that are not handed a loader use this one instead of
+    constructing (and re-validating the directory of) their own.
+
+    Returns:
+        Process-wide ConfigLoader instance
+    """
+    return ConfigLoader()
+
+
 def load_stocks() -> list[dict[str, Any]]:
     """
     Helper function to load stocks as dictionaries.
 
+    The YAML parse is cached until stocks.yaml changes; only the small
+    dictionaries are rebuilt per call.
+
     Returns:
         List of stock dictionaries
     """
-    loader = ConfigLoader()
+    loader = get_config_loader()
     stocks = loader.load_stocks()
 
     # Convert to dict format
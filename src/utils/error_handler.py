@@ -4,7 +4,6 @@ Error handling utilities and decorators
 Provides standardized error handling patterns for the KKAAK trading system.
 """
 
-import traceback
 from typing import Any
 
 from loguru import logger
@@ -72,8 +71,9 @@ class ErrorContext:
             return True
 
         # Log the error
-        logger.error(f"🚨 {self.operation_name} 실패: {exc_val}")
-        traceback.print_exc()
+        logger.opt(exception=(exc_type, exc_val, exc_tb)).error(
+            f"🚨 {self.operation_name} 실패: {exc_val}"
+        )
 
         # Send Discord notification
         if self.discord:
@@ -0,0 +1,170 @@
+"""
+File cache utilities
+
+Small JSON-on-disk cache with per-read TTL, shared across pipeline runs.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+
+class FileCache:
+    """
+    Persistent key/value cache stored as one JSON file per key.
+
+    Entries are written as ``{"ts": epoch, "data": ...}`` under
+    ``{cache_dir}/{namespace}/{md5(key)}.json``; freshness is decided by the
+    caller's TTL at read time, so one entry can serve readers with different
+    staleness budgets. Entries found expired or unreadable are deleted, and
+    files older than ``max_age`` are swept periodically, so the directory does
+    not grow without bound when keys are rarely repeated.
+
+    Usage:
+        cache = FileCache("data/cache")
+        quote = cache.get("quotes", "AAPL", ttl=60)
+        if quote is None:
+            quote = client.quote("AAPL")
+            cache.set("quotes", "AAPL", quote)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = "data/cache",
+        max_age: float = 24 * 3600,
+        prune_interval: float = 3600,
+    ):
+        """
+        Initialize file cache.
+
+        Args:
+            cache_dir: Root directory for cache files
+            max_age: Age in seconds after which any cache file is deleted by prune()
+            prune_interval: Minimum seconds between automatic prunes run from set()
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_age = max_age
+        self.prune_interval = prune_interval
+        self.hits = 0
+        self.misses = 0
+        # First set() of a process prunes, so short-lived runs clean up too
+        self._last_prune = float("-inf")
+
+    def _path(self, namespace: str, key: str) -> Path:
+        """Get the file path for a cache key."""
+        digest = hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+        return self.cache_dir / namespace / f"{digest}.json"
+
+    def get(self, namespace: str, key: str, ttl: float) -> Any | None:
+        """
+        Read a cached value if it is younger than ``ttl`` seconds.
+
+        Expired or unreadable entries are deleted.
+
+        Args:
+            namespace: Cache namespace (e.g. endpoint name)
+            key: Cache key within the namespace
+            ttl: Maximum entry age in seconds
+
+        Returns:
+            Cached data, or None on miss, expiry or unreadable entry
+        """
+        path = self._path(namespace, key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError):
+            self.misses += 1
+            self._discard(path)
+            return None
+
+        if time.time() - entry.get("ts", 0) > ttl:
+            self.misses += 1
+            self._discard(path)
+            return None
+
+        self.hits += 1
+        return entry.get("data")
+
+    def set(self, namespace: str, key: str, data: Any) -> None:
+        """
+        Store a JSON-serializable value.
+
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial file. Runs prune() at most
+        once per ``prune_interval``.
+
+        Args:
+            namespace: Cache namespace (e.g. endpoint name)
+            key: Cache key within the namespace
+            data: JSON-serializable value
+        """
+        path = self._path(namespace, key)
+        tmp_path = None
+        try:
+            payload = json.dumps({"ts": time.time(), "data": data}, ensure_ascii=False)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write cache entry {namespace}/{key}: {e}")
+            if tmp_path is not None:
+                self._discard(Path(tmp_path))
+
+        if time.monotonic() - self._last_prune >= self.prune_interval:
+            self.prune()
+
+    @staticmethod
+    def _discard(path: Path) -> bool:
+        """Delete a cache file, ignoring races with other readers/writers."""
+        try:
+            path.unlink()
+        except OSError:
+            return False
+        return True
+
+    def prune(self) -> int:
+        """
+        Delete cache files (including leftover temp files) older than ``max_age``.
+
+        Returns:
+            Number of files deleted
+        """
+        self._last_prune = time.monotonic()
+        cutoff = time.time() - self.max_age
+        removed = 0
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                namespaces = [entry.path for entry in entries if entry.is_dir()]
+        except OSError:
+            return 0
+
+        for namespace_dir in namespaces:
+            try:
+                with os.scandir(namespace_dir) as entries:
+                    stale = [
+                        entry.path
+                        for entry in entries
+                        if entry.is_file() and entry.stat().st_mtime < cutoff
+                    ]
+            except OSError as e:
+                logger.warning(f"Failed to prune cache directory {namespace_dir}: {e}")
+                continue
+
+            for path in stale:
+                removed += self._discard(Path(path))
+
+        if removed:
+            logger.debug(f"Pruned {removed} expired cache files from {self.cache_dir}")
+        return removed
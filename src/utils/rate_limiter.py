@@ -0,0 +1,45 @@
+"""
+Rate limiting utilities
+
+Thread-safe request pacing shared by concurrent API collectors.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Spaces call start times evenly so concurrent workers stay under an API limit.
+
+    Usage:
+        limiter = RateLimiter(calls_per_second=25)
+        limiter.acquire()  # blocks until the next slot is free
+        client.quote(ticker)
+    """
+
+    def __init__(self, calls_per_second: float):
+        """
+        Initialize rate limiter.
+
+        Args:
+            calls_per_second: Maximum call rate (0 or less disables limiting)
+        """
+        self.interval = 1.0 / calls_per_second if calls_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        """Block until the caller may start its request."""
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        # Sleep outside the lock so other workers can reserve later slots
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
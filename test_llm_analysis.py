@@ -19,6 +19,7 @@ sys.path.insert(0, str(project_root))
 
 from src.analysis.llm_agent import LLMAgent
 from src.analysis.models import TradingSignal
+from src.data.models import NewsArticle
 
 
 def load_sample_news(news_file: str = "data/news/news_20260212_222419.json") -> list:
@@ -30,7 +31,11 @@ def load_sample_news(news_file: str = "data/news/news_20260212_222419.json") ->
         return []
 
     with open(file_path, encoding="utf-8") as f:
-        articles = json.load(f)
+        if file_path.suffix == ".jsonl":
+            # NDJSON written by collect_news.py (one article per line)
+            articles = [NewsArticle.model_validate_json(line) for line in f if line.strip()]
+        else:
+            articles = [NewsArticle.model_validate(article) for article in json.load(f)]
 
     logger.info(f"Loaded {len(articles)} sample articles from {news_file}")
     return articles
@@ -57,7 +62,12 @@ def load_sample_prices(price_file: str = "data/prices/prices_20260212_224745.jso
         }
 
     with open(file_path, encoding="utf-8") as f:
-        price_data = json.load(f)
+        if file_path.suffix == ".jsonl":
+            # NDJSON snapshots written by collect_prices.py; use the latest one
+            *_, last_line = (line for line in f if line.strip())
+            price_data = json.loads(last_line)["quotes"]
+        else:
+            price_data = json.load(f)
 
     # Extract current prices
     prices = {ticker: data["current_price"] for ticker, data in price_data.items()}